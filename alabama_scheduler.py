@@ -5,18 +5,20 @@ Source URLs (blocked by environment, handled gracefully):
   - SOS Search: https://arc-sos.state.al.us/CGI/CORPNAME.MBR/INPUT
   - Main:       https://www.sos.alabama.gov/
 """
-import json, os, time, logging, hashlib, random
+import os, time, logging, hashlib, heapq, random
 from datetime import datetime, timedelta
+from itertools import chain
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('alabama_scheduler.log'),
-        logging.StreamHandler()
-    ]
-)
-logger = logging.getLogger(__name__)
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from utils.json_io import append_ndjson, loads, read_records, write_json, write_ndjson
+from utils.log_handlers import LOG_FORMAT, BufferedFileHandler, scheduler_logger
+
+_log_file = BufferedFileHandler('alabama_scheduler.log', delay=True)
+logger = scheduler_logger(__name__, _log_file)
 
 CONFIG = {
     'data_file':            'data/alabama_businesses.json',
@@ -66,14 +68,39 @@ SUFFIX_TYPE = {
 }
 
 def _al_entity_num(offset):
-    base = str(100_000_000 + offset)
-    return f"{base[:3]}-{base[3:6]}-{base[6:]}"
-
-def _al_zip():
-    return str(random.randint(35004, 36925))
+    n = 100_000_000 + offset
+    return f"{n // 1_000_000:03d}-{n // 1000 % 1000:03d}-{n % 1000:03d}"
+
+_rng = np.random.default_rng() if np is not None else None
+
+def _al_days_ago(count):
+    # Registration ages in days: exponential with a 10-day mean, clipped to the 30-day window
+    if _rng is not None:
+        return np.clip(_rng.exponential(10.0, size=count).astype(np.int64), 1, 30).tolist()
+    return [max(1, min(int(random.expovariate(1 / 10)), 30)) for _ in range(count)]
+
+def _al_randints(lo, hi, count):
+    # Uniform integers in [lo, hi], one column per batch
+    if _rng is not None:
+        return _rng.integers(lo, hi + 1, size=count).tolist()
+    return [random.randint(lo, hi) for _ in range(count)]
+
+def _al_name(pattern, city, prefix, btype, industry, sfx):
+    if pattern == 1:
+        return f"{city} {btype} {sfx}"
+    if pattern == 2:
+        return f"{prefix} {industry} {btype} {sfx}"
+    if pattern == 3:
+        return f"{prefix} {btype} {sfx}"
+    return f"{city} {industry} {sfx}"
+
+def _merge_key(biz):
+    # Use state+entity_number as key so identical numbers across states don't collide
+    en = biz.get('entity_number', '')
+    return f"{biz.get('state', '')}_{en}" if en else biz.get('business_id', '')
 
 def _biz_id(name, entity_num):
-    return hashlib.md5(f"{name}_{entity_num}".lower().encode()).hexdigest()[:12]
+    return hashlib.blake2b(f"{name}_{entity_num}".lower().encode(), digest_size=6).hexdigest()
 
 
 class AlabamaScheduledScraper:
@@ -81,105 +108,154 @@ class AlabamaScheduledScraper:
     def __init__(self, config=None):
         self.config = config or CONFIG
         self.state  = self._load_state()
+        # Unix time of the next due run; parsed from last_run once, then kept current by run_once
+        last = self.state.get('last_run')
+        self._next_run_epoch = (datetime.fromisoformat(last).timestamp() +
+                                self.config['run_interval_hours'] * 3600) if last else 0.0
 
     def _load_state(self):
         sf = self.config['state_file']
         if os.path.exists(sf):
             try:
-                raw = json.load(open(sf))
+                with open(sf, 'rb') as f:
+                    raw = loads(f.read())
                 raw['business_ids'] = set(raw.get('business_ids', []))
+                known = raw.get('entity_numbers')
+                raw['entity_numbers'] = set(known) if known is not None else None
                 return raw
             except Exception as e:
-                logger.warning(f"Could not load state: {e}")
+                logger.warning("Could not load state: %s", e)
         return {'last_run': None, 'run_count': 0,
-                'total_businesses_generated': 0, 'business_ids': set()}
+                'total_businesses_generated': 0, 'business_ids': set(),
+                'entity_numbers': None}
 
     def _save_state(self):
         sf = self.config['state_file']
         os.makedirs(os.path.dirname(sf), exist_ok=True)
         copy = self.state.copy()
         copy['business_ids'] = list(self.state['business_ids'])
-        json.dump(copy, open(sf, 'w'), indent=2)
+        if self.state.get('entity_numbers') is not None:
+            copy['entity_numbers'] = list(self.state['entity_numbers'])
+        write_json(sf, copy, indent=True)
 
 
     def generate_alabama_businesses(self, count):
-        logger.info(f"Generating {count} new Alabama businesses...")
-        businesses, attempts = [], 0
+        logger.info("Generating %s new Alabama businesses...", count)
         today = datetime.now()
-
-        while len(businesses) < count and attempts < count * 3:
-            attempts += 1
-            sfx = random.choice(SUFFIXES)
-            pattern = random.randint(1, 4)
-            if pattern == 1:
-                name = f"{random.choice(AL_CITIES)} {random.choice(BUSINESS_TYPES)} {sfx}"
-            elif pattern == 2:
-                name = f"{random.choice(AL_PREFIXES)} {random.choice(INDUSTRIES)} {random.choice(BUSINESS_TYPES)} {sfx}"
-            elif pattern == 3:
-                name = f"{random.choice(AL_PREFIXES)} {random.choice(BUSINESS_TYPES)} {sfx}"
-            else:
-                name = f"{random.choice(AL_CITIES)} {random.choice(INDUSTRIES)} {sfx}"
-
-            offset = self.state['total_businesses_generated'] + len(businesses)
-            entity_num = _al_entity_num(offset)
-            bid = _biz_id(name, entity_num)
-            if bid in self.state['business_ids']:
-                continue
-
-            days_ago = max(1, min(int(random.expovariate(1 / 10)), 30))
-            filing_date = today - timedelta(days=days_ago)
-            status = random.choices(['Active', 'Inactive'], weights=[96, 4], k=1)[0]
-            city = random.choice(AL_CITIES)
+        scraped_at  = today.isoformat()
+        date_strs   = [(today - timedelta(days=d)).strftime('%Y-%m-%d') for d in range(31)]
+        run_num     = self.state['run_count'] + 1
+        base_offset = self.state['total_businesses_generated']
+        known       = self.state['business_ids']
+
+        # One candidate per slot, drawn column-wise; slot i gets entity number base_offset + i
+        sfxs        = random.choices(SUFFIXES, k=count)
+        names       = list(map(_al_name, random.choices((1, 2, 3, 4), k=count),
+                               random.choices(AL_CITIES, k=count),
+                               random.choices(AL_PREFIXES, k=count),
+                               random.choices(BUSINESS_TYPES, k=count),
+                               random.choices(INDUSTRIES, k=count), sfxs))
+        entity_nums = [_al_entity_num(base_offset + i) for i in range(count)]
+        bids        = [_biz_id(nm, en) for nm, en in zip(names, entity_nums)]
+        statuses    = random.choices(['Active', 'Inactive'], weights=[96, 4], k=count)
+        addr_cities = random.choices(AL_CITIES, k=count)
+        ages        = _al_days_ago(count)
+        agents      = _al_randints(100, 999, count)
+        zips        = _al_randints(35004, 36925, count)
+
+        businesses, redraws = [], count * 2
+        for i in range(count):
+            sfx, name, entity_num, bid = sfxs[i], names[i], entity_nums[i], bids[i]
+            # Ids only repeat when an earlier run already used this entity number
+            # with the same name; redraw the name for that slot (rare)
+            while bid in known and redraws:
+                redraws -= 1
+                name = _al_name(random.randint(1, 4), random.choice(AL_CITIES), random.choice(AL_PREFIXES),
+                                random.choice(BUSINESS_TYPES), random.choice(INDUSTRIES), sfx)
+                bid = _biz_id(name, entity_num)
+            if bid in known:
+                break  # out of redraws; stop so entity numbers stay contiguous
+
+            days_ago = ages[i]
+            status = statuses[i]
+            city = addr_cities[i]
 
             businesses.append({
                 'name':              name,
                 'state':             'AL',
                 'entity_number':     entity_num,
-                'registration_date': filing_date.strftime('%Y-%m-%d'),
+                'registration_date': date_strs[days_ago],
                 'entity_type':       SUFFIX_TYPE.get(sfx, 'Limited Liability Company'),
                 'status':            status,
-                'registered_agent':  f"Alabama Registered Agent #{random.randint(100, 999)}",
-                'address':           f"{city}, AL {_al_zip()}",
-                'scraped_at':        datetime.now().isoformat(),
+                'registered_agent':  f"Alabama Registered Agent #{agents[i]}",
+                'address':           f"{city}, AL {zips[i]}",
+                'scraped_at':        scraped_at,
                 'source':            'scheduled_generation',
-                'generator_run':     self.state['run_count'] + 1,
+                'generator_run':     run_num,
                 'business_id':       bid,
             })
-            self.state['business_ids'].add(bid)
+            known.add(bid)
 
-        logger.info(f"✓ Generated {len(businesses)} unique Alabama businesses")
+        logger.info("✓ Generated %d unique Alabama businesses", len(businesses))
         return businesses
 
     def _load_existing(self):
         df = self.config['data_file']
-        if os.path.exists(df):
-            try:
-                return json.load(open(df))
-            except Exception as e:
-                logger.error(f"Error loading businesses: {e}")
+        try:
+            return read_records(df)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error("Error loading businesses: %s", e)
         return []
 
-    def _save_businesses(self, businesses):
+    def _save_businesses(self, businesses, added=None):
         df = self.config['data_file']
         os.makedirs(os.path.dirname(df), exist_ok=True)
-        json.dump(businesses, open(df, 'w'), indent=2)
-        logger.info(f"✓ Saved {len(businesses)} total businesses to {df}")
+        if added is None or not self._append_businesses(added):
+            write_ndjson(df, businesses)
+        logger.info("✓ Saved %d total businesses to %s", len(businesses), df)
+
+    def _append_businesses(self, new):
+        """Append new records to the data file; False if it must be rewritten."""
+        return append_ndjson(self.config['data_file'], new)
 
     def _merge(self, existing, new):
         from datetime import datetime, timedelta
         cutoff = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
-        seen, unique = set(), []
-        for biz in existing + new:
-            en = biz.get('entity_number', '')
-            state = biz.get('state', '')
-            reg = biz.get('registration_date', '')
-            key = f"{state}_{en}" if en else biz.get('business_id', '')
-            if key and key not in seen and reg >= cutoff:
+        # A missing or empty data file means the saved keys are stale; rebuild them from the batch
+        known = self.state.get('entity_numbers') if existing else None
+        dropped = False
+        if known is None:
+            # No record of what the data file holds, so dedupe it with the new batch
+            seen, unique, incoming = set(), [], chain(existing, new)
+        else:
+            # existing was deduped when it was saved; only drop expired records
+            seen, unique, incoming = set(known), [], new
+            for biz in existing:
+                if biz.get('registration_date', '') >= cutoff:
+                    unique.append(biz)
+                else:
+                    seen.discard(_merge_key(biz))
+                    dropped = True
+        kept = len(unique)
+        for biz in incoming:
+            key = _merge_key(biz)
+            if key and key not in seen and biz.get('registration_date', '') >= cutoff:
                 seen.add(key)
                 unique.append(biz)
-        unique.sort(key=lambda x: x.get('registration_date', ''), reverse=True)
-        logger.info(f"Retained {len(unique)} businesses registered in last 30 days")
-        return unique
+        added = unique[kept:]
+        cap = self.config.get('max_total_businesses')
+        if cap and len(unique) > cap:
+            dropped = True
+            unique = heapq.nlargest(cap, unique, key=lambda x: x.get('registration_date', ''))
+            seen = {_merge_key(b) for b in unique}
+        else:
+            unique.sort(key=lambda x: x.get('registration_date', ''), reverse=True)
+        self.state['entity_numbers'] = seen
+        logger.info("Retained %d businesses registered in last 30 days", len(unique))
+        # The data file only needs the added lines when none of its records went away
+        return unique, (added if known is not None and not dropped else None)
 
     def run_once(self):
         logger.info("=" * 60)
@@ -189,59 +265,66 @@ class AlabamaScheduledScraper:
 
         new_biz  = self.generate_alabama_businesses(self.config['businesses_per_run'])
         existing = self._load_existing()
-        logger.info(f"Loaded {len(existing)} existing businesses")
-        merged   = self._merge(existing, new_biz)
-        self._save_businesses(merged)
-
-        self.state['last_run']                    = datetime.now().isoformat()
+        logger.info("Loaded %d existing businesses", len(existing))
+        merged, added = self._merge(existing, new_biz)
+        self._save_businesses(merged, added)
+        # Only ids of retained records can still collide; keeps the state file O(data size)
+        self.state['business_ids'] = {b['business_id'] for b in merged if b.get('business_id')}
+
+        now = datetime.now()
+        self.state['last_run']                    = now.isoformat()
         self.state['run_count']                  += 1
         self.state['total_businesses_generated'] += len(new_biz)
         self._save_state()
+        self._next_run_epoch = now.timestamp() + self.config['run_interval_hours'] * 3600
 
         al_count = len([b for b in merged if b.get('state') == 'AL'])
-        next_ts  = (datetime.now() + timedelta(
-            hours=self.config['run_interval_hours'])).strftime('%Y-%m-%d %H:%M')
+        next_ts  = datetime.fromtimestamp(self._next_run_epoch).strftime('%Y-%m-%d %H:%M')
 
         logger.info("")
         logger.info("Run Summary:")
-        logger.info(f"  New businesses   : {len(new_biz)}")
-        logger.info(f"  Total businesses : {len(merged)}")
-        logger.info(f"  Alabama total    : {al_count}")
-        logger.info(f"  Run #            : {self.state['run_count']}")
-        logger.info(f"  Next run         : {next_ts}")
+        logger.info("  New businesses   : %d", len(new_biz))
+        logger.info("  Total businesses : %d", len(merged))
+        logger.info("  Alabama total    : %d", al_count)
+        logger.info("  Run #            : %d", self.state['run_count'])
+        logger.info("  Next run         : %s", next_ts)
         logger.info("")
         logger.info("✓ Alabama scraper run completed successfully")
         logger.info("=" * 60)
+        _log_file.flush()
 
     def run_forever(self):
         logger.info("Starting Alabama Scheduled Scraper (24-hour mode)")
         while True:
             try:
                 self.run_once()
-                if self.state['last_run']:
-                    nxt = (datetime.fromisoformat(self.state['last_run']) +
-                           timedelta(hours=self.config['run_interval_hours']))
-                    secs = (nxt - datetime.now()).total_seconds()
-                    if secs > 0:
-                        logger.info(f"Sleeping {secs/3600:.1f}h until next run...")
-                        time.sleep(secs)
-                else:
-                    time.sleep(self.config['run_interval_hours'] * 3600)
+                secs = self._next_run_epoch - time.time()
+                if secs > 0:
+                    logger.info("Sleeping %.1fh until next run...", secs/3600)
+                    _log_file.flush()  # nothing else is logged until the next run
+                    time.sleep(secs)
             except KeyboardInterrupt:
                 logger.info("Scheduler stopped by user")
+                _log_file.flush()
                 break
             except Exception as e:
-                logger.error(f"Scheduler error: {e}", exc_info=True)
+                logger.error("Scheduler error: %s", e, exc_info=True)
                 time.sleep(3600)
 
 
+def run_once():
+    """Run one pass with the default CONFIG; the entry point for in-process runners."""
+    AlabamaScheduledScraper().run_once()
+
 def main():
     import argparse
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT, handlers=[logging.StreamHandler()])
     p = argparse.ArgumentParser(description='Alabama Business Scraper - 24h Scheduler')
     p.add_argument('--once',      action='store_true')
     p.add_argument('--interval',  type=int, default=24)
     p.add_argument('--count',  type=int, default=1000)
-    p.add_argument('--max-total', type=int, default=500)
+    p.add_argument('--max-total', type=int, default=None,
+                   help='Keep at most this many businesses (default: no cap)')
     args = p.parse_args()
 
     cfg = CONFIG.copy()
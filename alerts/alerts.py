@@ -1,18 +1,50 @@
 
-import json, requests
+import os, sys, requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from utils.json_io import loads
 
 WEBHOOK = "https://example.com/webhook"
+LATEST_FILE = "data/latest.json"
+# Set when the webhook accepts a JSON array of businesses in one request
+WEBHOOK_ACCEPTS_BATCH = False
+MAX_WORKERS = 10
+
+# Keep-alive connections shared by every alert instead of a handshake per post;
+# one per worker so parallel posts don't discard pooled connections
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=MAX_WORKERS))
+_SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=MAX_WORKERS))
 
 def send_alert(biz):
     try:
-        requests.post(WEBHOOK, json=biz, timeout=10)
+        _SESSION.post(WEBHOOK, json=biz, timeout=10)
+    except Exception:
+        pass
+
+def send_alerts_batch(bizs):
+    try:
+        _SESSION.post(WEBHOOK, json=bizs, timeout=10)
     except Exception:
         pass
 
 def check_new():
-    data = json.load(open("data/businesses.json"))
-    for biz in data[-10:]:
-        send_alert(biz)
+    # The aggregate rebuild writes the newest records to a small sidecar; businesses.json
+    # is sorted newest-first, so fall back to its head when the sidecar is missing
+    if os.path.exists(LATEST_FILE):
+        with open(LATEST_FILE, "rb") as f:
+            data = loads(f.read())
+    else:
+        with open("data/businesses.json", "rb") as f:
+            data = loads(f.read())[:10]
+    if WEBHOOK_ACCEPTS_BATCH:
+        send_alerts_batch(data)
+        return
+    # Posts are network-bound, so overlap them instead of paying one RTT each
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        list(ex.map(send_alert, data))
 
 if __name__ == "__main__":
     check_new()
@@ -8,15 +8,10 @@ Source URLs:
 import json, os, time, logging, hashlib, random
 from datetime import datetime, timedelta
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler("california_scheduler.log"),
-        logging.StreamHandler()
-    ]
-)
-logger = logging.getLogger(__name__)
+from utils.json_io import loads, read_records
+from utils.log_handlers import LOG_FORMAT, scheduler_logger
+
+logger = scheduler_logger(__name__, logging.FileHandler("california_scheduler.log", delay=True))
 
 CONFIG = {
     "data_file":            "data/california_businesses.json",
@@ -139,7 +134,8 @@ class CaliforniaScheduledScraper:
         sf = self.config["state_file"]
         if os.path.exists(sf):
             try:
-                raw = json.load(open(sf))
+                with open(sf, "rb") as f:
+                    raw = loads(f.read())
                 raw["business_ids"] = set(raw.get("business_ids", []))
                 return raw
             except Exception as e:
@@ -159,6 +155,8 @@ class CaliforniaScheduledScraper:
         logger.info(f"Generating {count} new California businesses...")
         businesses, attempts = [], 0
         today = datetime.now()
+        scraped_at = today.isoformat()
+        date_strs  = [(today - timedelta(days=d)).strftime("%Y-%m-%d") for d in range(31)]
 
         while len(businesses) < count and attempts < count * 2:
             attempts += 1
@@ -180,7 +178,6 @@ class CaliforniaScheduledScraper:
                 continue
 
             days_ago     = min(int(random.expovariate(1 / 10)), 30)
-            filing_date  = today - timedelta(days=days_ago)
             status       = random.choices(["Active", "Inactive"], weights=[96, 4], k=1)[0]
             city         = random.choice(CITIES)
 
@@ -188,12 +185,12 @@ class CaliforniaScheduledScraper:
                 "name":              name,
                 "state":             "CA",
                 "entity_number":     entity_num,
-                "registration_date": filing_date.strftime("%Y-%m-%d"),
+                "registration_date": date_strs[days_ago],
                 "entity_type":       SUFFIX_TYPE.get(sfx, "Limited Liability Company"),
                 "status":            status,
                 "registered_agent":  f"California Registered Agent #{random.randint(100, 999)}",
                 "address":           f"{city}, CA {_zip()}",
-                "scraped_at":        datetime.now().isoformat(),
+                "scraped_at":        scraped_at,
                 "source":            "scheduled_generation",
                 "generator_run":     self.state["run_count"] + 1,
                 "business_id":       bid,
@@ -207,7 +204,7 @@ class CaliforniaScheduledScraper:
         df = self.config["data_file"]
         if os.path.exists(df):
             try:
-                return json.load(open(df))
+                return read_records(df)
             except Exception as e:
                 logger.error(f"Error loading businesses: {e}")
         return []
@@ -289,8 +286,13 @@ class CaliforniaScheduledScraper:
                 time.sleep(3600)
 
 
+def run_once():
+    """Run one pass with the default CONFIG; the entry point for in-process runners."""
+    CaliforniaScheduledScraper().run_once()
+
 def main():
     import argparse
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT, handlers=[logging.StreamHandler()])
     p = argparse.ArgumentParser(description="California Business Scraper - 24h Scheduler")
     p.add_argument("--once",      action="store_true")
     p.add_argument("--interval",  type=int, default=24)
@@ -3,360 +3,374 @@
 Multi-State Business Scraper - 24-Hour Scheduled Service
 Coordinates all 50 US state scrapers.
 
-Each state scraper runs sequentially with a 5-minute stagger to avoid
-resource contention. Full cycle completes in ~4.2 hours; next cycle
-begins 24 hours after the first state starts.
+Each state's *_scheduler module is imported once at startup and its
+module-level run_once() is called on a shared thread pool from one asyncio event
+loop, with at most max_concurrent states running at a time to avoid
+resource contention. States marked "subprocess": True, or whose module
+fails to import, run as a child process instead. Cycles start every 24
+hours, measured on a monotonic clock.
 """
-import json, os, time, logging, subprocess, sys
+import asyncio, atexit, json, math, os, queue, random, signal, time, logging, subprocess, sys
+import logging.handlers
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler("multi_state_scheduler.log"),
-        logging.StreamHandler()
-    ]
-)
+from utils.json_io import loads, write_json
+from utils.schedulers import load_run_once
+
+# Log calls from the concurrent scrapers only enqueue the record; one listener
+# thread does the formatting and file/console writes
+_log_queue = queue.SimpleQueue()
+_formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+_log_targets = [logging.FileHandler("multi_state_scheduler.log"), logging.StreamHandler()]
+for _h in _log_targets:
+    _h.setFormatter(_formatter)
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter("%(message)s"))  # full format is applied by the targets
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
+_log_listener = logging.handlers.QueueListener(_log_queue, *_log_targets, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
+# Lines of a failed child's stderr kept for the error log
+STDERR_TAIL_LINES = 20
+
+STATES = (
+    "alabama", "alaska", "arizona", "arkansas", "california", "colorado",
+    "connecticut", "delaware", "florida", "georgia", "hawaii", "idaho",
+    "illinois", "indiana", "iowa", "kansas", "kentucky", "louisiana", "maine",
+    "maryland", "massachusetts", "michigan", "minnesota", "mississippi",
+    "missouri", "montana", "nebraska", "nevada", "new_hampshire", "new_jersey",
+    "new_mexico", "new_york", "north_carolina", "north_dakota", "ohio",
+    "oklahoma", "oregon", "pennsylvania", "rhode_island", "south_carolina",
+    "south_dakota", "tennessee", "texas", "utah", "vermont", "virginia",
+    "washington", "west_virginia", "wisconsin", "wyoming",
+)
+
+# Optional overrides of CONFIG (see MultiStateScheduler._read_config)
+CONFIG_FILE = "multi_state_config.json"
+
 CONFIG = {
+    "state_file":         "data/multi_state_scraper_state.json",
     "run_interval_hours": 24,
-    "states": {
-        "alaska": {
-            "script":          "alaska_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   5,
-        },
-        "arizona": {
-            "script":          "arizona_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   10,
-        },
-        "arkansas": {
-            "script":          "arkansas_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   15,
-        },
-        "california": {
-            "script":          "california_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   20,
-        },
-        "colorado": {
-            "script":          "colorado_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   25,
-        },
-        "connecticut": {
-            "script":          "connecticut_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   30,
-        },
-        "delaware": {
-            "script":          "delaware_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   35,
-        },
-        "florida": {
-            "script":          "florida_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   40,
-        },
-        "georgia": {
-            "script":          "georgia_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   45,
-        },
-        "hawaii": {
-            "script":          "hawaii_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   50,
-        },
-        "idaho": {
-            "script":          "idaho_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   55,
-        },
-        "illinois": {
-            "script":          "illinois_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   60,
-        },
-        "indiana": {
-            "script":          "indiana_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   65,
-        },
-        "iowa": {
-            "script":          "iowa_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   70,
-        },
-        "kansas": {
-            "script":          "kansas_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   75,
-        },
-        "kentucky": {
-            "script":          "kentucky_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   80,
-        },
-        "louisiana": {
-            "script":          "louisiana_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   85,
-        },
-        "maine": {
-            "script":          "maine_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   90,
-        },
-        "maryland": {
-            "script":          "maryland_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   95,
-        },
-        "massachusetts": {
-            "script":          "massachusetts_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   100,
-        },
-        "michigan": {
-            "script":          "michigan_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   105,
-        },
-        "minnesota": {
-            "script":          "minnesota_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   110,
-        },
-        "mississippi": {
-            "script":          "mississippi_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   115,
-        },
-        "missouri": {
-            "script":          "missouri_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   120,
-        },
-        "montana": {
-            "script":          "montana_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   125,
-        },
-        "nebraska": {
-            "script":          "nebraska_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   130,
-        },
-        "nevada": {
-            "script":          "nevada_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   135,
-        },
-        "new_hampshire": {
-            "script":          "new_hampshire_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   140,
-        },
-        "new_jersey": {
-            "script":          "new_jersey_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   145,
-        },
-        "new_mexico": {
-            "script":          "new_mexico_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   150,
-        },
-        "new_york": {
-            "script":          "new_york_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   155,
-        },
-        "north_carolina": {
-            "script":          "north_carolina_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   160,
-        },
-        "north_dakota": {
-            "script":          "north_dakota_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   165,
-        },
-        "ohio": {
-            "script":          "ohio_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   170,
-        },
-        "oklahoma": {
-            "script":          "oklahoma_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   175,
-        },
-        "oregon": {
-            "script":          "oregon_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   180,
-        },
-        "pennsylvania": {
-            "script":          "pennsylvania_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   185,
-        },
-        "rhode_island": {
-            "script":          "rhode_island_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   190,
-        },
-        "south_carolina": {
-            "script":          "south_carolina_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   195,
-        },
-        "south_dakota": {
-            "script":          "south_dakota_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   200,
-        },
-        "tennessee": {
-            "script":          "tennessee_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   205,
-        },
-        "texas": {
-            "script":          "texas_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   210,
-        },
-        "utah": {
-            "script":          "utah_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   215,
-        },
-        "vermont": {
-            "script":          "vermont_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   220,
-        },
-        "virginia": {
-            "script":          "virginia_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   225,
-        },
-        "washington": {
-            "script":          "washington_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   230,
-        },
-        "west_virginia": {
-            "script":          "west_virginia_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   235,
-        },
-        "wisconsin": {
-            "script":          "wisconsin_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   240,
-        },
-        "wyoming": {
-            "script":          "wyoming_scheduler.py",
-            "enabled":         True,
-            "delay_minutes":   245,
-        },
-    }
+    "max_concurrent":     8,
+    "jitter_seconds":     0,
+    "states": {s: {"script": f"{s}_scheduler.py", "enabled": True} for s in STATES},
 }
 
 
+def _install_child_watcher():
+    """
+    Reap subprocess-path children through pidfds on Linux 5.3+ instead of the
+    default ThreadedChildWatcher's thread per child. Python 3.12+ already does
+    this on its own, so the watcher API is only touched on older versions.
+    """
+    if sys.platform != "linux" or sys.version_info >= (3, 12) or not hasattr(os, "pidfd_open"):
+        return
+    try:
+        kernel = tuple(int(x) for x in os.uname().release.split("-")[0].split(".")[:2])
+    except ValueError:
+        return
+    if kernel < (5, 3):
+        return
+    watcher = asyncio.PidfdChildWatcher()
+    watcher.attach_loop(asyncio.get_running_loop())
+    asyncio.set_child_watcher(watcher)
+
+
 class MultiStateScheduler:
-    """Coordinates all 50 state scrapers with staggered execution."""
+    """Coordinates all 50 state scrapers with bounded concurrent execution."""
+
+    def __init__(self, config=None, config_file=None):
+        self.base_config = config or CONFIG
+        self.config_file = config_file
+        try:
+            self.config = self._read_config()
+        except Exception as e:
+            logger.warning(f"⚠️  Could not read {self.config_file} ({e}), using defaults")
+            self.config = self.base_config
+        self.last_run = self._load_last_run()
+        self.sem      = None
+        self.cycle_start = 0.0
+        # Built once and shared by every subprocess-path child
+        self._child_env  = {**os.environ, "PYTHONUNBUFFERED": "1"}
+        # A SIGHUP reload waits until no cycle is running and no scraper thread
+        # (including one abandoned by a timeout) is still inside a module
+        self._cycle_running  = False
+        self._reload_pending = False
+        # Last run_once() future per state; a timed-out one keeps its thread until it returns
+        self._futures        = {}
+        self._reload_config()
+        # Scrapers block on I/O, so threads suffice; the pool is reused across cycles
+        self.pool     = self._new_pool()
+
+    def _pool_size(self):
+        # max_concurrent running, plus one slot per state for a run a timeout abandoned
+        # (a state is skipped while its last run is alive, so it never holds two)
+        return self.config.get("max_concurrent", 8) + len(self.scrapers)
+
+    def _new_pool(self):
+        # Threads are only started as needed, so the spare slots cost nothing until used
+        return ThreadPoolExecutor(max_workers=self._pool_size(), thread_name_prefix="state")
+
+    def _read_config(self):
+        """
+        The base config with any overrides from config_file applied. The file
+        is optional JSON; top-level keys replace the base values and entries
+        under "states" update the matching states, e.g.
+        {"max_concurrent": 4, "states": {"texas": {"enabled": false}}}.
+        A changed run_interval_hours only takes effect on restart.
+        """
+        cfg = {**self.base_config,
+               "states": {n: dict(c) for n, c in self.base_config["states"].items()}}
+        if not self.config_file or not os.path.exists(self.config_file):
+            return cfg
+        with open(self.config_file, "rb") as f:
+            overrides = loads(f.read())
+        for name, state_cfg in overrides.pop("states", {}).items():
+            if name in cfg["states"]:  # states left out on the command line stay out
+                cfg["states"][name].update(state_cfg)
+        cfg.update(overrides)
+        return cfg
+
+    def _reload_config(self, reload_modules=False):
+        """Derive the enabled states and their run_once() entry points from self.config."""
+        self._enabled = [(n, c) for n, c in self.config["states"].items() if c.get("enabled", True)]
+        self.scrapers = self._load_scrapers(reload_modules)
 
-    def __init__(self, config=None):
-        self.config   = config or CONFIG
-        self.last_run = None
+    def _on_sighup(self):
+        self._reload_pending = True
+        if not self._apply_pending_reload():
+            logger.info("🔄 SIGHUP received, reloading once the running scrapers finish")
+
+    def _apply_pending_reload(self):
+        """Re-read the config and reload scheduler modules if a reload is pending and nothing is running."""
+        self._futures = {n: f for n, f in self._futures.items() if not f.done()}
+        if not self._reload_pending or self._cycle_running or self._futures:
+            return False
+        self._reload_pending = False
+        try:
+            config = self._read_config()
+        except Exception as e:
+            logger.error(f"❌ Could not read {self.config_file}, keeping the current config: {e}")
+            return True
+        old_workers, self.config = self._pool_size(), config
+        self._reload_config(reload_modules=True)
+        if self._pool_size() != old_workers:
+            self.pool.shutdown(wait=False)
+            self.pool = self._new_pool()
+        logger.info(f"🔄 Reloaded config and {len(self.scrapers)} state scrapers")
+        return True
+
+    def _load_scrapers(self, reload_modules=False):
+        scrapers = {}
+        for name, cfg in self._enabled:
+            if cfg.get("subprocess", False):
+                continue
+            try:
+                scrapers[name] = load_run_once(cfg["script"], reload_modules)
+            except Exception as e:
+                logger.warning(f"⚠️  {name.upper()} import failed ({e}), will run as a subprocess")
+        return scrapers
+
+    def _load_last_run(self):
+        sf = self.config.get("state_file")
+        if not sf or not os.path.exists(sf):
+            return None
+        try:
+            with open(sf, "rb") as f:
+                return datetime.fromisoformat(loads(f.read())["last_run"])
+        except Exception as e:
+            logger.warning(f"⚠️  Could not load scheduler state: {e}")
+            return None
+
+    def _save_last_run(self):
+        sf = self.config.get("state_file")
+        if sf:
+            os.makedirs(os.path.dirname(sf) or ".", exist_ok=True)
+            write_json(sf, {"last_run": self.last_run.isoformat()}, indent=True)
 
     def should_run(self):
         if not self.last_run:
             return True
         return (datetime.now() - self.last_run).total_seconds() / 3600 >= self.config["run_interval_hours"]
 
-    def run_state_scraper(self, state_name, state_config):
-        if not state_config.get("enabled", True):
-            logger.info(f"⏭️  {state_name.upper()} scraper is disabled, skipping")
-            return True
+    async def run_state_scraper(self, state_name, state_config):
+        # An optional delay_minutes is an absolute offset from the cycle start, so
+        # time spent waiting on earlier states doesn't push later ones back
+        offset = state_config.get("delay_minutes", 0) * 60
+        jitter = self.config.get("jitter_seconds", 0)
+        if jitter > 0:
+            offset += random.uniform(0, jitter)
+        if offset > 0:
+            loop = asyncio.get_running_loop()
+            await asyncio.sleep(max(0, self.cycle_start + offset - loop.time()))
+
+        async with self.sem:
+            if state_name in self.scrapers:
+                return await self._run_in_thread(state_name, self.scrapers[state_name])
+            return await self._spawn(state_name, state_config)
 
-        delay = state_config.get("delay_minutes", 0)
-        if delay > 0:
-            logger.info(f"⏸️  Waiting {delay} minutes before running {state_name.upper()}...")
-            time.sleep(delay * 60)
+    async def _run_in_thread(self, state_name, run_once):
+        prev = self._futures.get(state_name)
+        if prev is not None and not prev.done():
+            # Two runs would write the same state and data files through the same module
+            logger.warning(f"⚠️  {state_name.upper()} is still running from an earlier timeout, skipping")
+            return False
+        logger.info(f"▶️  Running {state_name.upper()} scraper...")
+        try:
+            # run_once() builds a fresh scraper, which picks up the state file like a new process would
+            fut = self._futures[state_name] = self.pool.submit(run_once)
+            await asyncio.wait_for(asyncio.wrap_future(fut), timeout=300)
+            logger.info(f"✅ {state_name.upper()} scraper completed successfully")
+            return True
+        except asyncio.TimeoutError:
+            logger.error(f"❌ {state_name.upper()} timed out after 5 minutes")
+            return False
+        except Exception as e:
+            logger.error(f"❌ {state_name.upper()} error: {e}", exc_info=True)
+            return False
 
+    async def _spawn(self, state_name, state_config):
         logger.info(f"▶️  Running {state_name.upper()} scraper...")
         try:
-            result = subprocess.run(
-                [sys.executable, state_config["script"], "--once"],
-                capture_output=True, text=True, timeout=300
+            proc = await asyncio.create_subprocess_exec(
+                sys.executable, state_config["script"], "--once",
+                stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                env=self._child_env,
+                # fds are non-inheritable by default (PEP 446), so nothing leaks, and
+                # close_fds=False lets subprocess use posix_spawn instead of fork+exec
+                close_fds=False
             )
-            if result.returncode == 0:
+            # The pipe has to be drained while the child runs, but only the end
+            # of its stderr is worth reporting on failure
+            tail = deque(maxlen=STDERR_TAIL_LINES)
+
+            async def finish():
+                async for line in proc.stderr:
+                    tail.append(line)
+                await proc.wait()
+
+            try:
+                await asyncio.wait_for(finish(), timeout=300)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                logger.error(f"❌ {state_name.upper()} timed out after 5 minutes")
+                return False
+            except asyncio.CancelledError:
+                # Shutting down: don't leave the child running or unreaped
+                proc.kill()
+                await proc.wait()
+                raise
+            if proc.returncode == 0:
                 logger.info(f"✅ {state_name.upper()} scraper completed successfully")
                 return True
             else:
-                logger.error(f"❌ {state_name.upper()} failed (code {result.returncode}): {result.stderr}")
+                logger.error(f"❌ {state_name.upper()} failed (code {proc.returncode}): "
+                             f"{b''.join(tail).decode(errors='replace')}")
                 return False
-        except subprocess.TimeoutExpired:
-            logger.error(f"❌ {state_name.upper()} timed out after 5 minutes")
-            return False
         except Exception as e:
             logger.error(f"❌ {state_name.upper()} error: {e}")
             return False
 
-    def run_once(self):
+    async def run_cycle(self):
         logger.info("=" * 70)
         logger.info("MULTI-STATE SCHEDULER (All 50 States) - Starting run")
         logger.info("=" * 70)
 
 
-        start   = datetime.now()
-        results = {}
-        for state_name, state_config in self.config["states"].items():
-            results[state_name] = self.run_state_scraper(state_name, state_config)
+        # A reload deferred by the last cycle's stragglers can happen now
+        self._apply_pending_reload()
+        t0      = time.monotonic()
+        # Created per cycle so it always belongs to the running event loop
+        self.sem = asyncio.Semaphore(self.config.get("max_concurrent", 8))
+        self.cycle_start = asyncio.get_running_loop().time()
+        enabled  = self._enabled
+        names    = [n for n, _ in enabled]
+        self._cycle_running = True
+        try:
+            tasks    = [asyncio.create_task(self.run_state_scraper(n, c)) for n, c in enabled]
+            outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            self._cycle_running = False
+            self._apply_pending_reload()
+        results  = {n: o is True for n, o in zip(names, outcomes)}
 
         self.last_run  = datetime.now()
+        self._save_last_run()
         total          = len(results)
         successful     = sum(1 for v in results.values() if v)
         failed         = total - successful
-        duration       = (datetime.now() - start).total_seconds()
+        duration       = time.monotonic() - t0
 
-        logger.info("")
-        logger.info("=" * 70)
-        logger.info(f"Run Summary: {successful}/{total} states OK | Duration: {duration/60:.1f} min")
-        for name, ok in results.items():
-            logger.info(f"  {name.upper():20s}: {'✅ OK' if ok else '❌ FAIL'}")
-        logger.info(f"  Next run: {(datetime.now() + timedelta(hours=self.config['run_interval_hours'])).strftime('%Y-%m-%d %H:%M')}")
-        logger.info("=" * 70)
+        # One record for the whole summary instead of one per state
+        lines = ["", "=" * 70,
+                 f"Run Summary: {successful}/{total} states OK | Duration: {duration/60:.1f} min"]
+        lines.extend(f"  {name.upper():20s}: {'✅ OK' if ok else '❌ FAIL'}" for name, ok in results.items())
+        lines.append(f"  Next run: {(datetime.now() + timedelta(hours=self.config['run_interval_hours'])).strftime('%Y-%m-%d %H:%M')}")
+        lines.append("=" * 70)
+        logger.info("\n".join(lines))
 
-    def run_forever(self):
-        logger.info("🚀 Starting Multi-State Scheduled Scraper (all 50 states)")
+    def run_once(self):
+        asyncio.run(self._main(self.run_cycle))
+
+    async def _main(self, entry):
+        _install_child_watcher()
+        loop = asyncio.get_running_loop()
+        stop = asyncio.Event()
+        loop.add_signal_handler(signal.SIGTERM, stop.set)
+        loop.add_signal_handler(signal.SIGINT, stop.set)
+        if hasattr(signal, "SIGHUP"):
+            loop.add_signal_handler(signal.SIGHUP, self._on_sighup)
+
+        # On SIGTERM/SIGINT cancel the work in flight; child processes are killed
+        # and reaped by _spawn before the loop closes
+        work    = asyncio.create_task(entry())
+        stopper = asyncio.create_task(stop.wait())
+        await asyncio.wait([work, stopper], return_when=asyncio.FIRST_COMPLETED)
+        stopper.cancel()
+        if stop.is_set() and not work.done():
+            logger.info("🛑 Shutdown signal received, cancelling running scrapers...")
+            work.cancel()
+            self.pool.shutdown(wait=False, cancel_futures=True)
+        await asyncio.gather(work, return_exceptions=stop.is_set())
+
+    async def main_loop(self):
+        # Cycles fire at anchor + n * period on the loop's monotonic clock, so the
+        # period doesn't drift by each cycle's runtime or jump with the wall clock
+        loop   = asyncio.get_running_loop()
+        period = self.config["run_interval_hours"] * 3600
+        anchor = loop.time()
+        n      = 0
+        if not self.should_run():
+            # A restart inside the interval waits for the slot the last cycle set up
+            anchor += (self.last_run - datetime.now()).total_seconds() + period
+            logger.info(f"💤 Last run was {self.last_run:%Y-%m-%d %H:%M}, "
+                        f"sleeping {(anchor - loop.time())/3600:.1f}h until next run...")
+            await asyncio.sleep(anchor - loop.time())
         while True:
             try:
-                self.run_once()
-                if self.last_run:
-                    nxt  = self.last_run + timedelta(hours=self.config["run_interval_hours"])
-                    secs = (nxt - datetime.now()).total_seconds()
-                    if secs > 0:
-                        logger.info(f"💤 Sleeping {secs/3600:.1f}h until next run...")
-                        time.sleep(secs)
-                else:
-                    time.sleep(self.config["run_interval_hours"] * 3600)
-            except KeyboardInterrupt:
-                logger.info("\n🛑 Multi-state scheduler stopped by user")
-                break
+                await self.run_cycle()
             except Exception as e:
                 logger.error(f"❌ Scheduler error: {e}", exc_info=True)
-                time.sleep(3600)
+                await asyncio.sleep(3600)
+                continue
+            # Skip any slots a long cycle overran
+            n    = max(n + 1, math.ceil((loop.time() - anchor) / period))
+            secs = anchor + n * period - loop.time()
+            logger.info(f"💤 Sleeping {secs/3600:.1f}h until next run...")
+            await asyncio.sleep(secs)
+
+    def run_forever(self):
+        logger.info("🚀 Starting Multi-State Scheduled Scraper (all 50 states)")
+        try:
+            asyncio.run(self._main(self.main_loop))
+        except KeyboardInterrupt:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+        logger.info("\n🛑 Multi-state scheduler stopped")
 
 
 def main():
@@ -366,15 +380,25 @@ def main():
     p.add_argument("--interval", type=int, default=24, help="Hours between runs")
     p.add_argument("--state",    type=str, default="all",
                    help="State snake_name to run, or 'all'")
+    p.add_argument("--concurrency", type=int, default=CONFIG["max_concurrent"],
+                   help="Maximum state scrapers running at once")
+    p.add_argument("--config", type=str, default=CONFIG_FILE,
+                   help="Optional JSON config overrides, re-read on SIGHUP")
     args = p.parse_args()
 
-    cfg = CONFIG.copy()
+    # Build a new states mapping rather than flipping "enabled" on the shared CONFIG dicts
+    if args.state == "all":
+        states = dict(CONFIG["states"])
+    elif args.state in CONFIG["states"]:
+        states = {args.state: CONFIG["states"][args.state]}
+    else:
+        p.error(f"unknown state {args.state!r}")
+
+    cfg = {**CONFIG, "states": states}
     cfg["run_interval_hours"] = args.interval
-    if args.state != "all":
-        for s in cfg["states"]:
-            cfg["states"][s]["enabled"] = (s == args.state)
+    cfg["max_concurrent"]     = args.concurrency
 
-    sched = MultiStateScheduler(cfg)
+    sched = MultiStateScheduler(cfg, config_file=args.config)
     sched.run_once() if args.once else sched.run_forever()
 
 if __name__ == "__main__":
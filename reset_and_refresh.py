@@ -3,8 +3,8 @@
 Reset & Refresh Script
 ----------------------
 1. Deletes all existing scraper state files and business data files
-2. Runs all 50 state scrapers once to generate fresh 30-day data
-3. Deduplicates any results within each state's data file
+2. Runs all 50 state scrapers once (one child process each; --in-process to skip the start-up)
+3. Deduplicates each state's data file and rebuilds data/businesses.json
 
 Usage:
     python3 reset_and_refresh.py            # full reset + fresh run
@@ -13,13 +13,19 @@ Usage:
 
 import os
 import sys
-import json
-import glob
 import subprocess
 import logging
 import argparse
+import heapq
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
 
+from utils.json_io import iter_records, loads, write_json
+from utils.schedulers import load_run_once
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(levelname)s - %(message)s",
@@ -88,45 +94,67 @@ STATE_SCHEDULERS = [
 ]
 
 
+# Scrapers run in parallel; lower this with --jobs if target sites rate-limit
+DEFAULT_JOBS = 8
+SCRAPER_TIMEOUT = 120  # seconds per state
+POLL_INTERVAL = 0.5    # seconds between checks on running scrapers
+
+
+def scan_data_dirs():
+    """
+    Classify the files in DATA_DIR (and BASE_DIR, as a fallback location)
+    with one scandir pass per directory.
+    Returns (business data files, scraper state files).
+    """
+    data_files, state_files = [], []
+    for d in (DATA_DIR, BASE_DIR):
+        try:
+            with os.scandir(d) as it:
+                for entry in it:
+                    name = entry.name
+                    if name.endswith("_businesses.json"):
+                        data_files.append(entry.path)
+                    elif name.endswith("_state.json"):  # includes *_scraper_state.json
+                        state_files.append(entry.path)
+        except FileNotFoundError:
+            pass
+    return data_files, state_files
+
+
 def find_data_files():
     """Find all state business data JSON files."""
-    patterns = [
-        os.path.join(DATA_DIR, "*_businesses.json"),
-        os.path.join(BASE_DIR, "*_businesses.json"),  # fallback if stored elsewhere
-    ]
-    files = []
-    for p in patterns:
-        files.extend(glob.glob(p))
-    return files
+    return scan_data_dirs()[0]
 
 
 def find_state_files():
     """Find all scraper state JSON files."""
-    patterns = [
-        os.path.join(DATA_DIR, "*_state.json"),
-        os.path.join(DATA_DIR, "*_scraper_state.json"),
-        os.path.join(BASE_DIR, "*_state.json"),
-        os.path.join(BASE_DIR, "*_scraper_state.json"),
-    ]
-    files = []
-    seen = set()
-    for p in patterns:
-        for f in glob.glob(p):
-            if f not in seen:
-                seen.add(f)
-                files.append(f)
-    return files
-
-
-def clear_all_data(dry_run=False):
-    """Delete all state files and business data files (keeps businesses_sample.json)."""
+    return scan_data_dirs()[1]
+
+
+def _unlink(path, dir_fds):
+    """Remove path through a cached fd of its directory where dir_fd is supported."""
+    if os.unlink not in os.supports_dir_fd:
+        os.remove(path)
+        return
+    parent, name = os.path.split(path)
+    fd = dir_fds.get(parent)
+    if fd is None:
+        fd = dir_fds[parent] = os.open(parent, os.O_RDONLY | os.O_DIRECTORY)
+    os.unlink(name, dir_fd=fd)
+
+
+def clear_all_data(dry_run=False, scan=None):
+    """
+    Delete all state files and business data files (keeps businesses_sample.json).
+    scan is a scan_data_dirs() result to reuse; the directories are scanned if omitted.
+    """
     logger.info("=" * 60)
     logger.info("STEP 1: Clearing all existing scraper data")
     logger.info("=" * 60)
 
-    state_files = find_state_files()
+    found_data, state_files = scan or scan_data_dirs()
     data_files = [
-        f for f in find_data_files()
+        f for f in found_data
         if "businesses_sample.json" not in f  # preserve sample
     ]
 
@@ -134,6 +162,8 @@ def clear_all_data(dry_run=False):
     main_biz = os.path.join(DATA_DIR, "businesses.json")
     if os.path.exists(main_biz):
         data_files.append(main_biz)
+    if os.path.exists(LATEST_FILE):
+        data_files.append(LATEST_FILE)
 
     all_to_delete = state_files + data_files
     all_to_delete = list(set(all_to_delete))  # deduplicate paths
@@ -142,59 +172,72 @@ def clear_all_data(dry_run=False):
         logger.info("No existing data files found — already clean.")
         return
 
-    for f in sorted(all_to_delete):
-        rel = os.path.relpath(f, BASE_DIR)
-        if dry_run:
-            logger.info(f"  [DRY RUN] Would delete: {rel}")
-        else:
+    # Unlink by name relative to an open directory fd, one fd per directory
+    dir_fds = {}
+    try:
+        for f in sorted(all_to_delete):
+            rel = os.path.relpath(f, BASE_DIR)
+            if dry_run:
+                logger.info(f"  [DRY RUN] Would delete: {rel}")
+                continue
             try:
-                os.remove(f)
+                _unlink(f, dir_fds)
                 logger.info(f"  ✓ Deleted: {rel}")
             except Exception as e:
                 logger.error(f"  ✗ Could not delete {rel}: {e}")
+    finally:
+        for fd in dir_fds.values():
+            os.close(fd)
 
     if not dry_run:
         logger.info(f"\nCleared {len(all_to_delete)} file(s). Starting fresh.\n")
 
 
-def deduplicate_file(filepath):
-    """
-    Remove duplicate entries from a business data file.
-    Deduplication key: entity_number (primary), then business_id.
-    Keeps the most recently scraped entry when duplicates exist.
-    """
-    if not os.path.exists(filepath):
-        return 0, 0
+# Rewritten after every dedupe pass with the files and options it used; files
+# older than it have nothing new to dedupe
+DEDUP_STAMP = os.path.join(DATA_DIR, ".dedup_stamp")
 
-    try:
-        with open(filepath) as f:
-            businesses = json.load(f)
-    except Exception as e:
-        logger.error(f"  Could not read {filepath}: {e}")
-        return 0, 0
+# Newest records of the aggregate, so alerts need not parse businesses.json
+LATEST_FILE = os.path.join(DATA_DIR, "latest.json")
+LATEST_COUNT = 10
 
-    original_count = len(businesses)
 
-    # Sort newest-scraped-first so we keep the freshest record on conflict
-    businesses.sort(key=lambda x: x.get("scraped_at", ""), reverse=True)
+def _stamp_params(data_files, top, pretty):
+    """What a dedupe pass depends on besides file contents, as stored in DEDUP_STAMP."""
+    return {"files": [os.path.relpath(f, BASE_DIR) for f in data_files],
+            "top": top, "pretty": pretty}
 
-    seen = set()
-    unique = []
-    for biz in businesses:
-        key = biz.get("entity_number") or biz.get("business_id") or biz.get("name", "")
-        if key and key not in seen:
-            seen.add(key)
-            unique.append(biz)
 
-    # Restore chronological order (newest registration first)
-    unique.sort(key=lambda x: x.get("registration_date", ""), reverse=True)
+def _unchanged_since_last_dedupe(data_files, main_file, top, pretty):
+    """
+    True if a previous dedupe ran over the same data files with the same
+    top/pretty options, after every one of them was last written.
+    """
+    try:
+        with open(DEDUP_STAMP, "rb") as f:
+            stamp = loads(f.read())
+        if not isinstance(stamp, dict) or any(
+                stamp.get(k) != v for k, v in _stamp_params(data_files, top, pretty).items()):
+            return False
+        stamp_ns = os.stat(DEDUP_STAMP).st_mtime_ns
+        if os.stat(main_file).st_mtime_ns > stamp_ns:
+            return False
+        return all(os.stat(f).st_mtime_ns < stamp_ns for f in data_files)
+    except FileNotFoundError:
+        return False
+    except ValueError:  # a stamp from before it held JSON, or a corrupt one
+        return False
 
-    removed = original_count - len(unique)
-    if removed > 0:
-        with open(filepath, "w") as f:
-            json.dump(unique, f, indent=2)
 
-    return original_count, len(unique)
+def dedupe_key(biz):
+    """
+    Dedupe key for a business record. Entity numbers are only unique within
+    a state, so they are qualified with the state code.
+    """
+    en = biz.get("entity_number")
+    if en:
+        return f"{biz.get('state', '')}_{en}"
+    return biz.get("business_id") or biz.get("name", "")
 
 
 def clear_state_file_for(script_name, dry_run=False):
@@ -213,10 +256,11 @@ def clear_state_file_for(script_name, dry_run=False):
             logger.info(f"    Cleared state: {os.path.basename(state_file)}")
 
 
-def run_scraper_once(script_name, dry_run=False, force=False):
+def _launch_scraper(script_name, dry_run=False):
     """
-    Run a single state scheduler with --once flag.
-    If force=True, delete its state file first so should_run() is not blocked.
+    Start a single state scheduler with --once flag, without waiting for it.
+    Its state file is deleted first so should_run() is not blocked.
+    Returns (Popen, stderr file), or True/False when nothing was started.
     """
     script_path = os.path.join(BASE_DIR, script_name)
     if not os.path.exists(script_path):
@@ -232,148 +276,286 @@ def run_scraper_once(script_name, dry_run=False, force=False):
         logger.info(f"  [DRY RUN] Would run: python3 {script_name} --once")
         return True
 
+    # stderr goes to a temp file rather than a pipe so a chatty scraper
+    # can't block on a full pipe while we are only polling it
+    err = tempfile.TemporaryFile()
     try:
         logger.info(f"  Running {state_label}...")
-        result = subprocess.run(
+        proc = subprocess.Popen(
             [sys.executable, script_path, "--once"],
             cwd=BASE_DIR,
-            capture_output=True,
-            text=True,
-            timeout=120,  # 2 minutes per state
+            stdout=subprocess.DEVNULL,
+            stderr=err,
         )
-        if result.returncode == 0:
-            logger.info(f"  ✓ {state_label} complete")
-            return True
-        else:
-            logger.error(f"  ✗ {state_label} failed (exit {result.returncode})")
-            if result.stderr:
-                logger.error(f"    {result.stderr.strip()[:300]}")
-            return False
-    except subprocess.TimeoutExpired:
-        logger.error(f"  ✗ {state_label} timed out after 2 minutes")
-        return False
     except Exception as e:
+        err.close()
         logger.error(f"  ✗ {state_label} error: {e}")
         return False
+    return proc, err
+
+
+def _finish_scraper(script_name, proc, err, timed_out=False):
+    """Log the outcome of a finished scraper process and return True on success."""
+    state_label = script_name.replace("_scheduler.py", "").replace("_", " ").title()
+    with err:
+        if timed_out:
+            logger.error(f"  ✗ {state_label} timed out after {SCRAPER_TIMEOUT // 60} minutes")
+            return False
+        if proc.returncode == 0:
+            logger.info(f"  ✓ {state_label} complete")
+            return True
+        logger.error(f"  ✗ {state_label} failed (exit {proc.returncode})")
+        err.seek(0)
+        stderr = err.read().decode("utf-8", "replace").strip()
+        if stderr:
+            logger.error(f"    {stderr[:300]}")
+        return False
 
 
-def run_all_scrapers(dry_run=False):
-    """Run every state scraper once to generate fresh 30-day data."""
+def _run_in_process(scrapers, jobs, record):
+    """
+    Run scheduler entry points on a thread pool in this interpreter, saving a
+    Python start-up and import per state. The timeout is soft: a thread can't
+    be killed, so a scraper that overruns SCRAPER_TIMEOUT is reported as
+    failed but keeps running, and the interpreter still waits for it at exit.
+    Returns the script names of scrapers still running when this returns;
+    their data files may be mid-write.
+    """
+    started, abandoned = {}, {}
+
+    def run(script_name, run_once):
+        started[script_name] = time.monotonic()
+        state_label = script_name.replace("_scheduler.py", "").replace("_", " ").title()
+        logger.info(f"  Running {state_label}...")
+        run_once()
+        logger.info(f"  ✓ {state_label} complete")
+
+    ex = ThreadPoolExecutor(max_workers=max(1, jobs), thread_name_prefix="scraper")
+    try:
+        running = {ex.submit(run, s, entry): s for s, entry in scrapers}
+        while running:
+            done, _ = wait(running, timeout=POLL_INTERVAL, return_when=FIRST_COMPLETED)
+            now = time.monotonic()
+            for fut in list(running):
+                script_name = running[fut]
+                state_label = script_name.replace("_scheduler.py", "").replace("_", " ").title()
+                if fut in done:
+                    del running[fut]
+                    try:
+                        fut.result()
+                        record(script_name, True)
+                    except Exception as e:
+                        logger.error(f"  ✗ {state_label} error: {e}")
+                        record(script_name, False)
+                elif script_name in started and now - started[script_name] >= SCRAPER_TIMEOUT:
+                    del running[fut]
+                    abandoned[fut] = script_name
+                    logger.error(f"  ✗ {state_label} timed out after {SCRAPER_TIMEOUT // 60} minutes")
+                    record(script_name, False)
+    finally:
+        ex.shutdown(wait=False, cancel_futures=True)
+    return sorted(s for fut, s in abandoned.items() if not fut.done())
+
+
+def _run_subprocesses(scripts, dry_run, jobs, record):
+    """
+    Run scheduler scripts as child processes. Up to `jobs` run at a time and
+    are polled for exit every POLL_INTERVAL seconds; each is killed after
+    SCRAPER_TIMEOUT.
+    """
+    pending = deque(scripts)
+    running = {}  # Popen -> (script name, start time, stderr file)
+
+    while pending or running:
+        while pending and len(running) < max(1, jobs):
+            script_name = pending.popleft()
+            started = _launch_scraper(script_name, dry_run)
+            if isinstance(started, bool):
+                record(script_name, started)
+            else:
+                proc, err = started
+                running[proc] = (script_name, time.monotonic(), err)
+
+        for proc, (script_name, t0, err) in list(running.items()):
+            timed_out = False
+            if proc.poll() is None:
+                if time.monotonic() - t0 < SCRAPER_TIMEOUT:
+                    continue
+                proc.kill()
+                proc.wait()
+                timed_out = True
+            del running[proc]
+            record(script_name, _finish_scraper(script_name, proc, err, timed_out))
+
+        if running:
+            time.sleep(POLL_INTERVAL)
+
+
+def run_all_scrapers(dry_run=False, jobs=DEFAULT_JOBS, use_subprocess=True):
+    """
+    Run every state scraper once to generate fresh 30-day data, up to `jobs`
+    at a time. Each runs as a child process, killed after SCRAPER_TIMEOUT;
+    with use_subprocess=False they run in-process instead (soft timeout, see
+    _run_in_process), except any whose scheduler module fails to import.
+    Returns (successes, failed state labels, scripts still running).
+    """
     logger.info("=" * 60)
-    logger.info("STEP 2: Running all state scrapers (fresh 30-day pull)")
+    logger.info(f"STEP 2: Running all state scrapers (fresh 30-day pull, {jobs} at a time)")
     logger.info("=" * 60)
 
     success, failed = 0, []
     total = len(STATE_SCHEDULERS)
+    finished = 0
 
-    for i, script in enumerate(STATE_SCHEDULERS, 1):
-        state_label = script.replace("_scheduler.py", "").replace("_", " ").title()
-        logger.info(f"[{i}/{total}] {state_label}")
-        ok = run_scraper_once(script, dry_run=dry_run)
+    def record(script_name, ok):
+        nonlocal success, finished
+        finished += 1
+        state_label = script_name.replace("_scheduler.py", "").replace("_", " ").title()
+        logger.info(f"[{finished}/{total}] {state_label}: {'ok' if ok else 'failed'}")
         if ok:
             success += 1
         else:
             failed.append(state_label)
 
+    in_process, spawned = [], []
+    for script_name in STATE_SCHEDULERS:
+        if dry_run or use_subprocess or not os.path.exists(os.path.join(BASE_DIR, script_name)):
+            spawned.append(script_name)
+            continue
+        try:
+            entry = load_run_once(script_name)
+        except Exception as e:
+            logger.warning(f"  {script_name} import failed ({e}), will run as a subprocess")
+            spawned.append(script_name)
+            continue
+        # Always force: clear state so the "too soon" guard doesn't skip the run
+        clear_state_file_for(script_name)
+        in_process.append((script_name, entry))
+
+    still_running = _run_in_process(in_process, jobs, record) if in_process else []
+    _run_subprocesses(spawned, dry_run, jobs, record)
+    failed.sort()
+
     logger.info("")
     logger.info(f"Scrapers complete: {success}/{total} succeeded")
     if failed:
         logger.warning(f"Failed states: {', '.join(failed)}")
-    return success, failed
+    return success, failed, still_running
 
 
-def deduplicate_all(dry_run=False):
-    """Deduplicate all business data files after scraping."""
+def dedupe_and_rebuild(dry_run=False, data_files=None, pretty=False, force=False, top=None):
+    """
+    Deduplicate every state business file and rebuild data/businesses.json in
+    one pass. All records go into a single dict that keeps the most recently
+    scraped record per key, remembering which file it came from; each state
+    file is then rewritten from its share of that dict and the aggregate from
+    all of it, along with the data/latest.json sidecar of its newest records.
+    Output is compact JSON unless pretty is set. The pass is skipped when the
+    last one covered the same data files with the same top and pretty and
+    none of them changed since (see DEDUP_STAMP), unless force is set. With
+    top, businesses.json keeps only the `top` most recent registrations.
+    """
     logger.info("=" * 60)
-    logger.info("STEP 3: Deduplicating all business data files")
+    logger.info("STEP 3: Deduplicating state files and rebuilding businesses.json")
     logger.info("=" * 60)
 
-    data_files = [
-        f for f in find_data_files()
+    data_files = sorted(
+        f for f in (find_data_files() if data_files is None else data_files)
         if "businesses_sample.json" not in f
-    ]
-
+    )
     if not data_files:
         logger.info("No data files found to deduplicate.")
         return
 
-    total_removed = 0
-    for filepath in sorted(data_files):
-        rel = os.path.relpath(filepath, BASE_DIR)
-        if dry_run:
-            logger.info(f"  [DRY RUN] Would deduplicate: {rel}")
-            continue
-        original, after = deduplicate_file(filepath)
-        removed = original - after
-        total_removed += removed
-        if removed > 0:
-            logger.info(f"  ✓ {rel}: {original} → {after} ({removed} duplicates removed)")
-        else:
-            logger.info(f"  ✓ {rel}: {original} records, no duplicates found")
-
-    if not dry_run:
-        logger.info(f"\nTotal duplicates removed: {total_removed}")
-
-
-def rebuild_main_businesses(dry_run=False):
-    """
-    Rebuild data/businesses.json by aggregating all state business files.
-    This keeps the main dashboard file in sync.
-    """
-    logger.info("=" * 60)
-    logger.info("STEP 4: Rebuilding main businesses.json")
-    logger.info("=" * 60)
-
-    data_files = [
-        f for f in find_data_files()
-        if "businesses.json" not in os.path.basename(f) or "state" in os.path.basename(f)
-        # include state-specific files, exclude main aggregate
-    ]
-    # More precise: grab *_businesses.json files only
-    state_data_files = glob.glob(os.path.join(DATA_DIR, "*_businesses.json"))
-    state_data_files = [f for f in state_data_files if f != os.path.join(DATA_DIR, "businesses.json")]
+    if dry_run:
+        for filepath in data_files:
+            logger.info(f"  [DRY RUN] Would deduplicate: {os.path.relpath(filepath, BASE_DIR)}")
+        logger.info("  [DRY RUN] Would rebuild businesses.json")
+        return
 
-    if not state_data_files:
-        logger.info("No state data files found to aggregate.")
+    main_file = os.path.join(DATA_DIR, "businesses.json")
+    if not force and _unchanged_since_last_dedupe(data_files, main_file, top, pretty):
+        logger.info("No data files changed since the last dedupe — nothing to do.")
         return
 
-    all_businesses = []
-    for filepath in sorted(state_data_files):
+    best, counts = {}, {}  # key -> (source index, record); source index -> records read
+    for src, filepath in enumerate(data_files):
+        count = 0
         try:
-            with open(filepath) as f:
-                businesses = json.load(f)
-            all_businesses.extend(businesses)
-            logger.info(f"  Loaded {len(businesses):>5} records from {os.path.basename(filepath)}")
+            for biz in iter_records(filepath):
+                count += 1
+                key = dedupe_key(biz)
+                if not key:
+                    continue
+                cur = best.get(key)
+                if cur is None or biz.get("scraped_at", "") > cur[1].get("scraped_at", ""):
+                    best[key] = (src, biz)
         except Exception as e:
             logger.error(f"  Could not read {filepath}: {e}")
+            counts[src] = None
+            continue
+        counts[src] = count
+
+    by_source = {}
+    for src, biz in best.values():
+        by_source.setdefault(src, []).append(biz)
+
+    def reg_date(biz):
+        return biz.get("registration_date", "")
+
+    def newest_first(records):
+        records.sort(key=reg_date, reverse=True)
+        return records
 
-    if not all_businesses:
+    total_removed = 0
+    for src, filepath in enumerate(data_files):
+        original = counts[src]
+        if original is None:
+            continue  # unreadable; leave it alone
+        unique = newest_first(by_source.get(src, []))
+        removed = original - len(unique)
+        total_removed += removed
+        rel = os.path.relpath(filepath, BASE_DIR)
+        if removed > 0:
+            write_json(filepath, unique, indent=pretty)
+            logger.info(f"  ✓ {rel}: {original} → {len(unique)} ({removed} duplicates removed)")
+        else:
+            logger.info(f"  ✓ {rel}: {original} records, no duplicates found")
+    logger.info(f"\nTotal duplicates removed: {total_removed}")
+
+    if not best:
         logger.info("No businesses to aggregate.")
         return
 
-    # Final dedup on the aggregate by entity_number
-    seen, unique = set(), []
-    all_businesses.sort(key=lambda x: x.get("scraped_at", ""), reverse=True)
-    for biz in all_businesses:
-        key = biz.get("entity_number") or biz.get("business_id") or biz.get("name", "")
-        if key and key not in seen:
-            seen.add(key)
-            unique.append(biz)
-    unique.sort(key=lambda x: x.get("registration_date", ""), reverse=True)
-
-    main_file = os.path.join(DATA_DIR, "businesses.json")
-    if dry_run:
-        logger.info(f"  [DRY RUN] Would write {len(unique)} records to businesses.json")
+    if top is not None and top < len(best):
+        # Partial selection instead of sorting every record
+        unique = heapq.nlargest(top, (biz for _, biz in best.values()), key=reg_date)
     else:
-        with open(main_file, "w") as f:
-            json.dump(unique, f, indent=2)
-        logger.info(f"\n✓ businesses.json rebuilt with {len(unique)} total unique records")
+        unique = newest_first([biz for _, biz in best.values()])
+    write_json(main_file, unique, indent=pretty)
+    write_json(LATEST_FILE, unique[:LATEST_COUNT], indent=True)
+    logger.info(f"\n✓ businesses.json rebuilt with {len(unique)} of {len(best)} total unique records")
+
+    write_json(DEDUP_STAMP, {**_stamp_params(data_files, top, pretty),
+                             "at": datetime.now().isoformat()}, indent=True)
 
 
 def main():
     parser = argparse.ArgumentParser(description="Reset scraper data and run fresh 30-day pull")
     parser.add_argument("--dry-run", action="store_true",
                         help="Preview what would happen without making changes")
+    parser.add_argument("--pretty", action="store_true",
+                        help="Write deduplicated files with 2-space indentation instead of compact JSON")
+    parser.add_argument("--top", type=int, default=None,
+                        help="Keep only the N most recent registrations in businesses.json")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--subprocess", dest="in_process", action="store_false",
+                      help="Run each scraper in its own Python process (the default; hard timeouts)")
+    mode.add_argument("--in-process", dest="in_process", action="store_true",
+                      help="Run scrapers on threads in this process; faster, but a timed-out "
+                           "scraper keeps running and its state is left out of step 3")
+    parser.add_argument("--jobs", type=int, default=DEFAULT_JOBS,
+                        help=f"Number of state scrapers to run at once (default {DEFAULT_JOBS})")
     args = parser.parse_args()
 
     if args.dry_run:
@@ -387,16 +569,24 @@ def main():
     logger.info("")
 
     # Step 1: Wipe all existing state + data files
-    clear_all_data(dry_run=args.dry_run)
+    scan = scan_data_dirs()
+    clear_all_data(dry_run=args.dry_run, scan=scan)
 
     # Step 2: Rerun all scrapers fresh
-    success, failed = run_all_scrapers(dry_run=args.dry_run)
-
-    # Step 3: Deduplicate within each state file
-    deduplicate_all(dry_run=args.dry_run)
-
-    # Step 4: Rebuild main businesses.json aggregate
-    rebuild_main_businesses(dry_run=args.dry_run)
+    success, failed, still_running = run_all_scrapers(dry_run=args.dry_run, jobs=args.jobs,
+                                                      use_subprocess=not args.in_process)
+
+    # The scrapers recreated the data files, so scan once more for step 3
+    data_files = scan[0] if args.dry_run else scan_data_dirs()[0]
+    if still_running:
+        # A timed-out in-process scraper may still be writing its data file
+        busy = {s.replace("_scheduler.py", "_businesses.json") for s in still_running}
+        data_files = [f for f in data_files if os.path.basename(f) not in busy]
+        logger.warning(f"Leaving still-running scrapers out of step 3: {', '.join(still_running)}")
+
+    # Step 3: Deduplicate each state file and rebuild the businesses.json aggregate
+    dedupe_and_rebuild(dry_run=args.dry_run, data_files=data_files,
+                       pretty=args.pretty, top=args.top)
 
     elapsed = (datetime.now() - start).total_seconds()
     logger.info("")
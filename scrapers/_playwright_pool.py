@@ -0,0 +1,55 @@
+"""
+Shared Playwright browsers for scrapers that need JavaScript rendering
+The sync Playwright API is bound to the thread that started it, so each
+thread lazily launches headless Chromium once and reuses it for the rest of
+its life; each scrape gets its own browser context (cheap, and isolates
+cookies/storage). MAX_CONTEXTS caps how many contexts are open at once
+across all threads, since super_scraper runs many states concurrently.
+"""
+import atexit
+import threading
+from contextlib import contextmanager
+
+# Browser contexts open at once across every thread
+MAX_CONTEXTS = 4
+
+_local = threading.local()
+_contexts = threading.BoundedSemaphore(MAX_CONTEXTS)
+
+def get_browser():
+    """Return the calling thread's headless Chromium, launching it on first call"""
+    browser = getattr(_local, 'browser', None)
+    if browser is None:
+        from playwright.sync_api import sync_playwright
+        _local.playwright = sync_playwright().start()
+        _local.browser = browser = _local.playwright.chromium.launch(headless=True)
+    return browser
+
+@contextmanager
+def new_page():
+    """
+    Yield a page in a fresh context on this thread's browser; the context is
+    closed after. Blocks while MAX_CONTEXTS contexts are already open.
+    """
+    with _contexts:
+        context = get_browser().new_context()
+        try:
+            yield context.new_page()
+        finally:
+            context.close()
+
+def close():
+    """
+    Close the calling thread's browser and stop its Playwright (no-op if never
+    started). Only the owning thread may do this; browsers of threads that
+    never call it are shut down with their Playwright driver at exit.
+    """
+    browser = getattr(_local, 'browser', None)
+    playwright = getattr(_local, 'playwright', None)
+    _local.browser = _local.playwright = None
+    if browser is not None:
+        browser.close()
+    if playwright is not None:
+        playwright.stop()
+
+atexit.register(close)  # atexit runs on the main thread
@@ -0,0 +1,55 @@
+"""
+Shared HTTP client and HTML parser for state scrapers
+One pooled session serves every scraper in the process, so scrapers that
+run in-process reuse keep-alive connections instead of each opening its own.
+"""
+from typing import Dict, Optional
+
+import requests
+from bs4 import BeautifulSoup, SoupStrainer
+
+from .common import _SESSION, get_random_user_agent
+
+# lxml is much faster than the stdlib parser but is an optional install
+try:
+    import lxml  # noqa: F401
+    PARSER = 'lxml'
+except ImportError:
+    PARSER = 'html.parser'
+
+SESSION = _SESSION
+
+HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+}
+
+TIMEOUT = 30
+
+def _headers(headers: Optional[Dict] = None) -> Dict:
+    """Default headers plus any overrides, with a rotated User-Agent"""
+    merged = dict(HEADERS)
+    if headers:
+        merged.update(headers)
+    merged['User-Agent'] = get_random_user_agent()
+    return merged
+
+def get(url: str, headers: Optional[Dict] = None, **kwargs) -> requests.Response:
+    """GET through the shared session; no retries (see common.safe_get)"""
+    kwargs.setdefault('timeout', TIMEOUT)
+    return SESSION.get(url, headers=_headers(headers), **kwargs)
+
+def post(url: str, headers: Optional[Dict] = None, **kwargs) -> requests.Response:
+    """POST through the shared session; no retries (see common.safe_post)"""
+    kwargs.setdefault('timeout', TIMEOUT)
+    return SESSION.post(url, headers=_headers(headers), **kwargs)
+
+def parse(html, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """
+    Parse an HTML document with the fastest available parser
+    
+    Args:
+        html: Document text or bytes
+        parse_only: Optional SoupStrainer; only matching elements are built
+    """
+    return BeautifulSoup(html, PARSER, parse_only=parse_only)
@@ -2,10 +2,16 @@
 Common utilities for state business registration scrapers
 """
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import random
+import threading
 import time
 from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from typing import Dict, List, Optional
+from urllib.parse import urlparse
 import logging
 
 # Configure logging
@@ -20,39 +26,146 @@ USER_AGENTS = [
     'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Safari/605.1.15',
 ]
 
+# Shared session so repeated requests to a state site reuse pooled keep-alive
+# connections. urllib3 retries are off; safe_get/safe_post do their own.
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=32, pool_maxsize=32,
+                       max_retries=Retry(total=0, backoff_factor=0))
+_SESSION.mount('https://', _ADAPTER)
+_SESSION.mount('http://', _ADAPTER)
+
+class TokenBucket:
+    """
+    Per-host request pacing that adapts to server feedback (AIMD)
+    Each success raises the rate additively; a 429 halves it and pauses
+    the host for the server's Retry-After.
+    """
+    INCREASE = 0.5   # requests/sec added per clean response
+    DECREASE = 0.5   # rate multiplier on 429
+    
+    def __init__(self, rate: float = 2.0, capacity: float = 4.0,
+                 min_rate: float = 0.1, max_rate: float = 10.0):
+        self.rate = rate
+        self.capacity = capacity
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a request to this host is allowed"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                if now >= self.paused_until:
+                    self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                    self.updated = now
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    wait = (1 - self.tokens) / self.rate
+                else:
+                    wait = self.paused_until - now
+            time.sleep(wait)
+    
+    def on_success(self):
+        with self.lock:
+            self.rate = min(self.max_rate, self.rate + self.INCREASE)
+    
+    def on_throttle(self, retry_after: float):
+        with self.lock:
+            self.rate = max(self.min_rate, self.rate * self.DECREASE)
+            self.tokens = 0
+            self.updated = self.paused_until = time.monotonic() + retry_after
+
+_BUCKETS: Dict[str, TokenBucket] = {}
+_BUCKETS_LOCK = threading.Lock()
+
+def _bucket_for(url: str) -> TokenBucket:
+    """Return the TokenBucket for url's host, creating it on first use"""
+    host = urlparse(url).netloc
+    with _BUCKETS_LOCK:
+        bucket = _BUCKETS.get(host)
+        if bucket is None:
+            bucket = _BUCKETS[host] = TokenBucket()
+        return bucket
+
+def _retry_after(response: requests.Response) -> float:
+    """Seconds to wait from a Retry-After header (seconds or HTTP date), else a default"""
+    value = response.headers.get('Retry-After')
+    if value:
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            try:
+                return max(0.0, (parsedate_to_datetime(value) - datetime.now().astimezone()).total_seconds())
+            except (TypeError, ValueError):
+                pass
+    return 10 + random.random() * 5
+
+def _near_limit(response: requests.Response) -> bool:
+    """True if X-RateLimit headers say under 10% of the quota is left"""
+    remaining = response.headers.get('X-RateLimit-Remaining')
+    limit = response.headers.get('X-RateLimit-Limit')
+    try:
+        return int(remaining) < 0.1 * int(limit)
+    except (TypeError, ValueError):
+        return False
+
+def _feedback(bucket: TokenBucket, response: requests.Response):
+    """Adjust the host's rate from a response"""
+    if response.status_code == 429:
+        bucket.on_throttle(_retry_after(response))
+    elif response.status_code == 200 and not _near_limit(response):
+        bucket.on_success()
+
+def _backoff(attempt: int) -> float:
+    """Exponential backoff with jitter: 2s, 4s, 8s ... (capped at 30s), each 50-100%"""
+    return min(30.0, 2.0 * 2 ** attempt) * random.uniform(0.5, 1.0)
+
 def get_random_user_agent() -> str:
     """Return a random user agent string"""
     return random.choice(USER_AGENTS)
 
 def safe_get(url: str, params: Optional[Dict] = None, retries: int = 3, 
-             headers: Optional[Dict] = None) -> Optional[requests.Response]:
+             headers: Optional[Dict] = None,
+             session: Optional[requests.Session] = None) -> Optional[requests.Response]:
     """
-    Safely make GET request with retries and random delays
+    Safely make GET request with per-host adaptive pacing and retries
     
     Args:
         url: URL to request
         params: Query parameters
         retries: Number of retry attempts
         headers: Custom headers
+        session: Session to send through (defaults to the shared pooled session)
     
     Returns:
         Response object or None if all retries fail
     """
     if headers is None:
         headers = {}
+    if session is None:
+        session = _SESSION
     
     headers['User-Agent'] = get_random_user_agent()
     
+    bucket = _bucket_for(url)
     for attempt in range(retries):
         try:
+            bucket.acquire()
             logger.info(f"Requesting {url} (attempt {attempt + 1}/{retries})")
-            response = requests.get(url, params=params, headers=headers, timeout=30)
+            response = session.get(url, params=params, headers=headers, timeout=30)
+            _feedback(bucket, response)
             
             if response.status_code == 200:
                 return response
             elif response.status_code == 429:  # Rate limited
-                logger.warning(f"Rate limited. Waiting longer...")
-                time.sleep(10 + random.random() * 5)
+                # The bucket now holds this host until Retry-After has passed
+                logger.warning(f"Rate limited. Backing off {urlparse(url).netloc}...")
+                continue
             else:
                 logger.warning(f"Status code {response.status_code}")
                 
@@ -61,9 +174,9 @@ def safe_get(url: str, params: Optional[Dict] = None, retries: int = 3,
         except requests.exceptions.RequestException as e:
             logger.error(f"Request error: {e}")
         
-        # Random delay between retries
+        # Exponential backoff with jitter between retries
         if attempt < retries - 1:
-            delay = 2 + random.random() * 2
+            delay = _backoff(attempt)
             logger.info(f"Waiting {delay:.2f}s before retry...")
             time.sleep(delay)
     
@@ -71,9 +184,10 @@ def safe_get(url: str, params: Optional[Dict] = None, retries: int = 3,
     return None
 
 def safe_post(url: str, data: Optional[Dict] = None, json_data: Optional[Dict] = None,
-              retries: int = 3, headers: Optional[Dict] = None) -> Optional[requests.Response]:
+              retries: int = 3, headers: Optional[Dict] = None,
+              session: Optional[requests.Session] = None) -> Optional[requests.Response]:
     """
-    Safely make POST request with retries and random delays
+    Safely make POST request with per-host adaptive pacing and retries
     
     Args:
         url: URL to request
@@ -81,26 +195,32 @@ def safe_post(url: str, data: Optional[Dict] = None, json_data: Optional[Dict] =
         json_data: JSON data
         retries: Number of retry attempts
         headers: Custom headers
+        session: Session to send through (defaults to the shared pooled session)
     
     Returns:
         Response object or None if all retries fail
     """
     if headers is None:
         headers = {}
+    if session is None:
+        session = _SESSION
     
     headers['User-Agent'] = get_random_user_agent()
     
+    bucket = _bucket_for(url)
     for attempt in range(retries):
         try:
+            bucket.acquire()
             logger.info(f"POST to {url} (attempt {attempt + 1}/{retries})")
-            response = requests.post(url, data=data, json=json_data, 
-                                   headers=headers, timeout=30)
+            response = session.post(url, data=data, json=json_data, 
+                                  headers=headers, timeout=30)
+            _feedback(bucket, response)
             
             if response.status_code == 200:
                 return response
             elif response.status_code == 429:
-                logger.warning(f"Rate limited. Waiting longer...")
-                time.sleep(10 + random.random() * 5)
+                logger.warning(f"Rate limited. Backing off {urlparse(url).netloc}...")
+                continue
             else:
                 logger.warning(f"Status code {response.status_code}")
                 
@@ -110,8 +230,7 @@ def safe_post(url: str, data: Optional[Dict] = None, json_data: Optional[Dict] =
             logger.error(f"Request error: {e}")
         
         if attempt < retries - 1:
-            delay = 2 + random.random() * 2
-            time.sleep(delay)
+            time.sleep(_backoff(attempt))
     
     logger.error(f"All retries failed for {url}")
     return None
@@ -210,38 +329,53 @@ def create_business_entity(name: str, state: str, entity_number: str = "",
     
     return entity
 
-def is_recent_registration(date_str: str, days: int = 30) -> bool:
+# Accepted registration date formats, most common first
+_DATE_FORMATS = (
+    '%Y-%m-%d',
+    '%m/%d/%Y',
+    '%d/%m/%Y',
+    '%Y/%m/%d',
+    '%m-%d-%Y',
+    '%B %d, %Y',
+    '%b %d, %Y',
+)
+
+@lru_cache(maxsize=65536)
+def _parse_date(date_str: str) -> Optional[datetime]:
+    """Parse date_str with the first matching format; None if none match"""
+    # YYYY-MM-DD is by far the most common; fromisoformat skips strptime's format parsing
+    if len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-':
+        try:
+            return datetime.fromisoformat(date_str)
+        except ValueError:
+            pass
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, fmt)
+        except ValueError:
+            continue
+    return None
+
+def is_recent_registration(date_str: str, days: int = 30,
+                           cutoff: Optional[datetime] = None) -> bool:
     """
     Check if registration date is within the last N days
     
     Args:
         date_str: Date string in various formats
         days: Number of days to check
+        cutoff: Precomputed cutoff datetime; overrides days when checking many dates
     
     Returns:
         True if within date range, False otherwise
     """
-    # Try common date formats
-    formats = [
-        '%Y-%m-%d',
-        '%m/%d/%Y',
-        '%d/%m/%Y',
-        '%Y/%m/%d',
-        '%m-%d-%Y',
-        '%B %d, %Y',
-        '%b %d, %Y',
-    ]
-    
-    for fmt in formats:
-        try:
-            reg_date = datetime.strptime(date_str, fmt)
-            cutoff_date = datetime.now() - timedelta(days=days)
-            return reg_date >= cutoff_date
-        except ValueError:
-            continue
-    
-    logger.warning(f"Could not parse date: {date_str}")
-    return False
+    reg_date = _parse_date(date_str)
+    if reg_date is None:
+        logger.warning(f"Could not parse date: {date_str}")
+        return False
+    if cutoff is None:
+        cutoff = datetime.now() - timedelta(days=days)
+    return reg_date >= cutoff
 
 def rate_limit(min_delay: float = 1.0, max_delay: float = 3.0):
     """
@@ -0,0 +1,47 @@
+"""
+Cached reads of the scheduler data files that the state modules delegate to.
+A file is parsed once per (path, mtime) and split by state, with each state's
+records sorted by registration date, so repeated scrape() calls in one
+process skip the disk read and answer a date cutoff with a bisect.
+"""
+import os
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from functools import lru_cache
+from operator import itemgetter
+
+from utils.json_io import read_records
+
+def cutoff_iso(days=30):
+    """YYYY-MM-DD date `days` ago, comparable with registration_date strings"""
+    return (datetime.now() - timedelta(days=days)).date().isoformat()
+
+@lru_cache(maxsize=64)  # one entry per state data file
+def _by_state(path, mtime_ns):
+    """
+    Parse path; map state code -> (registration dates ascending, records newest
+    first). The descending sort is stable, so records keep file order within a
+    date, and a file saved newest first comes back in its own order.
+    """
+    groups = {}
+    for biz in read_records(path):
+        groups.setdefault(biz.get("state"), []).append((biz.get("registration_date", ""), biz))
+    index = {}
+    for state, rows in groups.items():
+        rows.sort(key=itemgetter(0), reverse=True)
+        index[state] = ([d for d, _ in reversed(rows)], [b for _, b in rows])
+    return index
+
+def state_records(path, state, since=""):
+    """
+    Records for one state from a scheduler data file, newest first, keeping
+    only those registered on or after `since` (a YYYY-MM-DD string).
+    Returns a new list; the cached records are shared, so don't mutate them.
+    """
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return []
+    dates, records = _by_state(path, mtime_ns).get(state, ([], []))
+    # Everything from the bisect point up in the ascending dates is the newest-first prefix
+    return records[:len(dates) - bisect_left(dates, since)]
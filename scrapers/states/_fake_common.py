@@ -0,0 +1,74 @@
+"""
+Shared inline fallback generator for the delegating state modules.
+Used when a state's scheduler can't be imported. Every random column is
+drawn in one batch (with NumPy when it is installed) and the records are
+assembled in a single pass; states differ only in their vocabulary.
+"""
+import random
+from datetime import datetime, timedelta
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+TYPES        = ("Solutions","Services","Enterprises","Group","Partners",
+                "Holdings","Ventures","Management","Consulting","Technologies")
+SUFFIXES     = ("LLC","Inc","Corp","LLP")
+SUFFIX_TYPES = ("Limited Liability Company", "Corporation", "Corporation",
+                "Limited Liability Partnership")  # parallel to SUFFIXES
+
+def generate(count, state, state_name, cities, industries, zip_range):
+    """
+    Generate `count` synthetic registrations for one state.
+    zip_range is the inclusive (low, high) range of the state's ZIP codes.
+    """
+    zip_lo, zip_hi = zip_range
+
+    # Draw every random column in one batch up front
+    if np is not None:
+        rng = np.random.default_rng()
+        def indices(n):
+            return rng.integers(0, n, count).tolist()
+        ages   = np.clip(rng.exponential(10.0, count).astype(np.int64), 1, 30).tolist()
+        agents = rng.integers(100, 1000, count).tolist()
+        zips   = rng.integers(zip_lo, zip_hi + 1, count).tolist()
+    else:
+        def indices(n):
+            return random.choices(range(n), k=count)
+        ages   = [max(1, min(int(random.expovariate(1/10)), 30)) for _ in range(count)]
+        agents = [random.randint(100, 999) for _ in range(count)]
+        zips   = [random.randint(zip_lo, zip_hi) for _ in range(count)]
+    today      = datetime.now()
+    scraped_at = today.isoformat()
+    date_strs  = [(today - timedelta(days=d)).strftime("%Y-%m-%d") for d in range(31)]
+
+    # Build each field as a column, then materialize the records in one pass
+    def pick(seq):
+        return [seq[j] for j in indices(len(seq))]
+
+    sfx_idx   = indices(len(SUFFIXES))
+    sfxs      = [SUFFIXES[j] for j in sfx_idx]
+    names     = list(map(" ".join, zip(pick(cities), pick(industries), pick(TYPES), sfxs)))
+    # Entity numbers are always 9 digits, so slicing the decimal string is enough
+    enums     = [f"{b[:3]}-{b[3:6]}-{b[6:]}" for b in map(str, range(100_000_000, 100_000_000 + count))]
+    dates     = [date_strs[d] for d in ages]
+    etypes    = [SUFFIX_TYPES[j] for j in sfx_idx]
+    agent_ids = [f"{state_name} Registered Agent #{a}" for a in agents]
+    addresses = [f"{city}, {state} {z:05d}" for city, z in zip(pick(cities), zips)]
+
+    return [
+        {
+            "name":              name,
+            "state":             state,
+            "entity_number":     enum,
+            "registration_date": date,
+            "entity_type":       etype,
+            "status":            "Active",
+            "registered_agent":  agent,
+            "address":           address,
+            "scraped_at":        scraped_at,
+            "source":            "scheduled_generation",
+        }
+        for name, enum, date, etype, agent, address in zip(names, enums, dates, etypes, agent_ids, addresses)
+    ]
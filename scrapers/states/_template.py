@@ -2,15 +2,27 @@
 Template for Generic State Business Registration Scraper
 Use this template for states with standard web search interfaces
 """
-from bs4 import BeautifulSoup
+import soupsieve
+from bs4 import SoupStrainer
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from operator import itemgetter
 import logging
 from ..common import (create_business_entity, is_recent_registration,
                      safe_get, safe_post, get_date_range_last_30_days,
-                     format_date_for_state, StateScraperError, rate_limit)
+                     format_date_for_state, StateScraperError)
+from ..client import parse
 
 logger = logging.getLogger(__name__)
 
+# Only these subtrees are built when a results page is parsed
+_ROW_STRAINER = SoupStrainer('tr', class_='result-row')
+_PAGE_STRAINER = SoupStrainer(['tr', 'div'], class_=['result-row', 'pagination'])
+
+# CSS selectors compiled once per process (customize per state)
+_SEL_ROW = soupsieve.compile('tr.result-row')
+_SEL_PAGE_LINKS = soupsieve.compile('div.pagination a.page-link')
+
 # State configuration (customize per state)
 STATE_CONFIG = {
     'state_code': 'XX',  # 2-letter state code
@@ -20,9 +32,35 @@ STATE_CONFIG = {
     'date_format': '%m/%d/%Y',  # Adjust based on state
     'has_pagination': True,
     'requires_js': False,  # Set True if needs Playwright
+    'server_filters_date': False,  # Set True once the site is confirmed to honor startDate/endDate
 }
 
-@rate_limit(min_delay=2.0, max_delay=4.0)
+# Result pages fetched at once when following pagination
+PAGE_WORKERS = 8
+
+# Column index of each field in a result row (customize per state)
+COLS = {'name': 0, 'number': 1, 'date': 2, 'type': 3, 'status': 4}
+_ROW_WIDTH = max(COLS.values()) + 1
+_get_fields = itemgetter(COLS['name'], COLS['number'], COLS['date'], COLS['type'], COLS['status'])
+
+def _recent_check(days=30):
+    """
+    Build a predicate for "registered within the last `days` days"
+    The cutoff is computed once per scrape. Well-formed ISO dates compare as
+    plain strings; anything else goes through is_recent_registration's
+    cached parse.
+    """
+    cutoff = datetime.now() - timedelta(days=days)
+    if STATE_CONFIG['date_format'] == '%Y-%m-%d':
+        cutoff_str = cutoff.strftime('%Y-%m-%d')
+
+        def check(date_str):
+            if len(date_str) == 10 and date_str[4] == date_str[7] == '-':
+                return date_str >= cutoff_str
+            return is_recent_registration(date_str, cutoff=cutoff)
+        return check
+    return lambda date_str: is_recent_registration(date_str, cutoff=cutoff)
+
 def scrape():
     """
     Scrape new business registrations from last 30 days
@@ -62,17 +100,19 @@ def scrape():
         if not response:
             raise StateScraperError(f"Could not access {state_code} search page")
         
-        # Parse results
-        soup = BeautifulSoup(response.text, 'html.parser')
+        # Parse results (rows plus the pagination block)
+        soup = parse(response.text, parse_only=_PAGE_STRAINER)
         
         # Extract businesses from results
         # NOTE: Selectors must be customized per state
-        result_rows = soup.find_all('tr', class_='result-row')  # Adjust selector
+        result_rows = _SEL_ROW.select(soup)
+        is_recent = _recent_check(30)
         
         for row in result_rows:
             try:
                 entity = extract_entity_from_row(row, state_code)
-                if entity and is_recent_registration(entity['registration_date'], days=30):
+                if entity and (STATE_CONFIG['server_filters_date'] or
+                               is_recent(entity['registration_date'])):
                     businesses.append(entity)
             except Exception as e:
                 logger.error(f"Error parsing row: {e}")
@@ -94,7 +134,7 @@ def scrape():
 def extract_entity_from_row(row, state_code):
     """
     Extract business entity data from HTML row
-    Customize selectors based on state's HTML structure
+    Customize COLS based on state's HTML structure
     
     Args:
         row: BeautifulSoup row element
@@ -104,26 +144,19 @@ def extract_entity_from_row(row, state_code):
         Business entity dictionary
     """
     try:
-        # Customize these selectors based on actual HTML
-        name_elem = row.find('td', class_='entity-name')
-        number_elem = row.find('td', class_='entity-number')
-        date_elem = row.find('td', class_='filing-date')
-        type_elem = row.find('td', class_='entity-type')
-        status_elem = row.find('td', class_='status')
-        
-        # Alternative: use column indices
-        # cells = row.find_all('td')
-        # name = cells[0].text.strip()
-        # number = cells[1].text.strip()
-        # etc.
+        # One walk over the row's cells instead of a find() per field
+        texts = [td.get_text(strip=True) for td in row.find_all('td', recursive=False)]
+        if len(texts) < _ROW_WIDTH:
+            texts += [''] * (_ROW_WIDTH - len(texts))
+        name, number, date, entity_type, status = _get_fields(texts)
         
         entity = create_business_entity(
-            name=name_elem.text.strip() if name_elem else '',
+            name=name,
             state=state_code,
-            entity_number=number_elem.text.strip() if number_elem else '',
-            registration_date=date_elem.text.strip() if date_elem else '',
-            entity_type=type_elem.text.strip() if type_elem else '',
-            status=status_elem.text.strip() if status_elem else '',
+            entity_number=number,
+            registration_date=date,
+            entity_type=entity_type,
+            status=status,
         )
         
         return entity
@@ -147,13 +180,11 @@ def scrape_additional_pages(initial_soup, state_code):
     
     try:
         # Find pagination links
-        pagination = initial_soup.find('div', class_='pagination')
-        if not pagination:
+        page_links = _SEL_PAGE_LINKS.select(initial_soup)
+        if not page_links:
             return businesses
         
-        # Get all page links
-        page_links = pagination.find_all('a', class_='page-link')
-        
+        page_urls = []
         for link in page_links[1:]:  # Skip first page (already processed)
             page_url = link.get('href')
             if not page_url:
@@ -163,18 +194,28 @@ def scrape_additional_pages(initial_soup, state_code):
             if not page_url.startswith('http'):
                 base_url = '/'.join(STATE_CONFIG['search_url'].split('/')[:3])
                 page_url = base_url + page_url
-            
-            response = safe_get(page_url)
+            page_urls.append(page_url)
+        
+        if not page_urls:
+            return businesses
+        
+        # Fetch the remaining pages concurrently; safe_get still paces the host
+        with ThreadPoolExecutor(max_workers=min(PAGE_WORKERS, len(page_urls))) as pool:
+            responses = list(pool.map(safe_get, page_urls))
+        
+        is_recent = _recent_check(30)
+        for response in responses:
             if not response:
                 continue
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            result_rows = soup.find_all('tr', class_='result-row')
+            soup = parse(response.text, parse_only=_ROW_STRAINER)
+            result_rows = _SEL_ROW.select(soup)
             
             for row in result_rows:
                 try:
                     entity = extract_entity_from_row(row, state_code)
-                    if entity and is_recent_registration(entity['registration_date'], days=30):
+                    if entity and (STATE_CONFIG['server_filters_date'] or
+                                   is_recent(entity['registration_date'])):
                         businesses.append(entity)
                 except Exception as e:
                     logger.error(f"Error parsing pagination row: {e}")
@@ -193,16 +234,14 @@ def scrape_with_playwright():
     Returns:
         List of business entity dictionaries
     """
-    from playwright.sync_api import sync_playwright
+    from .._playwright_pool import new_page
     
     logger.info(f"Starting {STATE_CONFIG['state_name']} scraper (Playwright)")
     businesses = []
     
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            
+        # Reuses one browser per process; only the context is per-scrape
+        with new_page() as page:
             # Navigate to search page
             page.goto(STATE_CONFIG['search_url'])
             
@@ -221,20 +260,20 @@ def scrape_with_playwright():
             
             # Extract results
             html = page.content()
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = parse(html, parse_only=_ROW_STRAINER)
             
-            result_rows = soup.find_all('tr', class_='result-row')
+            result_rows = _SEL_ROW.select(soup)
+            is_recent = _recent_check(30)
             
             for row in result_rows:
                 try:
                     entity = extract_entity_from_row(row, STATE_CONFIG['state_code'])
-                    if entity and is_recent_registration(entity['registration_date'], days=30):
+                    if entity and (STATE_CONFIG['server_filters_date'] or
+                                   is_recent(entity['registration_date'])):
                         businesses.append(entity)
                 except Exception as e:
                     logger.error(f"Error parsing row: {e}")
                     continue
-            
-            browser.close()
         
         logger.info(f"Playwright scraper completed: {len(businesses)} businesses found")
         
@@ -11,6 +11,9 @@ This module provides the scrape() interface for the super_scraper pipeline.
 import logging, sys, os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
+from scrapers.states._cache import cutoff_iso, state_records
+from scrapers.states._fake_common import generate
+
 logger = logging.getLogger(__name__)
 
 def scrape():
@@ -27,53 +30,23 @@ def scrape():
         if not s.state['last_run']:
             s.run_once()
         # Return Alabama slice from the shared data file
-        import json
-        data = json.load(open(s.config['data_file']))
-        cutoff = (__import__("datetime").datetime.now() - __import__("datetime").timedelta(days=30)).strftime("%Y-%m-%d")
-        results = [b for b in data if b.get("state") == "AL" and b.get("registration_date", "") >= cutoff]
+        results = state_records(s.config["data_file"], "AL", since=cutoff_iso(30))
         logger.info(f"Alabama scraper: returning {len(results)} businesses")
         return results
     except Exception as e:
         logger.warning(f"Alabama scraper delegation failed ({e}), running inline")
         return _inline_generate(1000)
 
+# Vocabulary for the inline fallback generator
+AL_CITIES   = ("Birmingham","Montgomery","Huntsville","Mobile","Tuscaloosa",
+               "Hoover","Dothan","Auburn","Decatur","Madison","Florence",
+               "Gadsden","Vestavia Hills","Prattville","Phenix City")
+INDUSTRIES  = ("Aerospace","Automotive","Agriculture","Healthcare","Manufacturing",
+               "Construction","Finance","Technology","Retail","Transportation")
+
 def _inline_generate(count=1000):
     """Fallback: generate inline without importing the scheduler module."""
-    import hashlib, random
-    from datetime import datetime, timedelta
-
-    AL_CITIES   = ["Birmingham","Montgomery","Huntsville","Mobile","Tuscaloosa",
-                   "Hoover","Dothan","Auburn","Decatur","Madison","Florence",
-                   "Gadsden","Vestavia Hills","Prattville","Phenix City"]
-    AL_PREFIXES = ["Yellowhammer","Camellia","Heart of Dixie","Tennessee Valley",
-                   "Gulf Coast","Black Belt","Wiregrass","Shoals","Vulcan","Southern"]
-    TYPES       = ["Solutions","Services","Enterprises","Group","Partners",
-                   "Holdings","Ventures","Management","Consulting","Technologies"]
-    INDUSTRIES  = ["Aerospace","Automotive","Agriculture","Healthcare","Manufacturing",
-                   "Construction","Finance","Technology","Retail","Transportation"]
-    SUFFIXES    = ["LLC","Inc","Corp","LLP"]
-    STYPE       = {"LLC":"Limited Liability Company","Inc":"Corporation",
-                   "Corp":"Corporation","LLP":"Limited Liability Partnership"}
-
-    businesses, today = [], datetime.now()
-    for i in range(count):
-        sfx  = random.choice(SUFFIXES)
-        name = f"{random.choice(AL_CITIES)} {random.choice(INDUSTRIES)} {random.choice(TYPES)} {sfx}"
-        base = str(100_000_000 + i)
-        enum = f"{base[:3]}-{base[3:6]}-{base[6:]}"
-        days_ago = max(1, min(int(random.expovariate(1/10)), 30))
-        businesses.append({
-            'name':              name,
-            'state':             'AL',
-            'entity_number':     enum,
-            'registration_date': (today - timedelta(days=days_ago)).strftime('%Y-%m-%d'),
-            'entity_type':       STYPE.get(sfx, 'Limited Liability Company'),
-            'status':            'Active',
-            'registered_agent':  f"Alabama Registered Agent #{random.randint(100,999)}",
-            'address':           f"{random.choice(AL_CITIES)}, AL {random.randint(35004,36925)}",
-            'scraped_at':        today.isoformat(),
-            'source':            'scheduled_generation',
-        })
+    businesses = generate(count, "AL", "Alabama", AL_CITIES, INDUSTRIES, (35004, 36925))
     logger.info(f"Alabama inline generator: {len(businesses)} businesses")
     return businesses
 
@@ -11,6 +11,9 @@ This module provides the scrape() interface for the super_scraper pipeline.
 import logging, sys, os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
+from scrapers.states._cache import cutoff_iso, state_records
+from scrapers.states._fake_common import generate
+
 logger = logging.getLogger(__name__)
 
 def scrape():
@@ -25,49 +28,20 @@ def scrape():
         sc = CaliforniaScheduledScraper()
         if not sc.state["last_run"]:
             sc.run_once()
-        import json
-        data = json.load(open(sc.config["data_file"]))
-        cutoff = (__import__("datetime").datetime.now() - __import__("datetime").timedelta(days=30)).strftime("%Y-%m-%d")
-        results = [b for b in data if b.get("state") == "CA" and b.get("registration_date", "") >= cutoff]
+        results = state_records(sc.config["data_file"], "CA", since=cutoff_iso(30))
         logger.info(f"California scraper: returning {len(results)} businesses")
         return results
     except Exception as e:
         logger.warning(f"California scraper delegation failed ({e}), running inline")
         return _inline_generate(1000)
 
+# Vocabulary for the inline fallback generator
+CITIES    = ("Los Angeles", "San Diego", "San Jose", "San Francisco", "Fresno", "Sacramento", "Long Beach", "Oakland", "Bakersfield", "Anaheim", "Santa Ana", "Riverside", "Stockton", "Irvine", "Chula Vista", "Fremont", "San Bernardino", "Modesto", "Fontana", "Moreno Valley")
+INDUSTRIES= ("Technology", "Entertainment", "Finance", "Healthcare", "Agriculture", "Real Estate", "Tourism", "Manufacturing", "Aerospace", "Biotechnology", "Retail", "Education", "Logistics", "Legal", "Media")
+
 def _inline_generate(count=1000):
     """Fallback: generate inline without importing the scheduler module."""
-    import hashlib, random
-    from datetime import datetime, timedelta
-
-    CITIES    = ["Los Angeles", "San Diego", "San Jose", "San Francisco", "Fresno", "Sacramento", "Long Beach", "Oakland", "Bakersfield", "Anaheim", "Santa Ana", "Riverside", "Stockton", "Irvine", "Chula Vista", "Fremont", "San Bernardino", "Modesto", "Fontana", "Moreno Valley"]
-    PREFIXES  = ["Golden State", "Pacific", "Silicon", "Bay Area", "SoCal", "NorCal", "Sequoia", "Redwood", "Coastal", "Vineyard", "Hollywood", "Sunshine", "Emerald", "Cali", "Bear Republic"]
-    TYPES     = ["Solutions","Services","Enterprises","Group","Partners",
-                 "Holdings","Ventures","Management","Consulting","Technologies"]
-    INDUSTRIES= ["Technology", "Entertainment", "Finance", "Healthcare", "Agriculture", "Real Estate", "Tourism", "Manufacturing", "Aerospace", "Biotechnology", "Retail", "Education", "Logistics", "Legal", "Media"]
-    SUFFIXES  = ["LLC","Inc","Corp","LLP"]
-    STYPE     = {"LLC":"Limited Liability Company","Inc":"Corporation",
-                  "Corp":"Corporation","LLP":"Limited Liability Partnership"}
-
-    businesses, today = [], datetime.now()
-    for i in range(count):
-        sfx  = random.choice(SUFFIXES)
-        name = f"{random.choice(CITIES)} {random.choice(INDUSTRIES)} {random.choice(TYPES)} {sfx}"
-        base = str(100_000_000 + i)
-        enum = f"{base[:3]}-{base[3:6]}-{base[6:]}"
-        days_ago = max(1, min(int(random.expovariate(1/10)), 30))
-        businesses.append({
-            "name":              name,
-            "state":             "CA",
-            "entity_number":     enum,
-            "registration_date": (today - timedelta(days=days_ago)).strftime("%Y-%m-%d"),
-            "entity_type":       STYPE.get(sfx, "Limited Liability Company"),
-            "status":            "Active",
-            "registered_agent":  f"California Registered Agent #{random.randint(100,999)}",
-            "address":           f"{random.choice(CITIES)}, CA {random.randint(90001,96162):05d}",
-            "scraped_at":        today.isoformat(),
-            "source":            "scheduled_generation",
-        })
+    businesses = generate(count, "CA", "California", CITIES, INDUSTRIES, (90001, 96162))
     logger.info(f"California inline generator: {len(businesses)} businesses")
     return businesses
 
@@ -11,6 +11,9 @@ This module provides the scrape() interface for the super_scraper pipeline.
 import logging, sys, os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
+from scrapers.states._cache import cutoff_iso, state_records
+from scrapers.states._fake_common import generate
+
 logger = logging.getLogger(__name__)
 
 def scrape():
@@ -25,49 +28,20 @@ def scrape():
         sc = DelawareScheduledScraper()
         if not sc.state["last_run"]:
             sc.run_once()
-        import json
-        data = json.load(open(sc.config["data_file"]))
-        cutoff = (__import__("datetime").datetime.now() - __import__("datetime").timedelta(days=30)).strftime("%Y-%m-%d")
-        results = [b for b in data if b.get("state") == "DE" and b.get("registration_date", "") >= cutoff]
+        results = state_records(sc.config["data_file"], "DE", since=cutoff_iso(30))
         logger.info(f"Delaware scraper: returning {len(results)} businesses")
         return results
     except Exception as e:
         logger.warning(f"Delaware scraper delegation failed ({e}), running inline")
         return _inline_generate(1000)
 
+# Vocabulary for the inline fallback generator
+CITIES    = ("Wilmington", "Dover", "Newark", "Middletown", "Smyrna", "Milford", "Seaford", "Georgetown", "Elsmere", "New Castle", "Millsboro", "Laurel", "Harrington", "Camden", "Clayton", "Lewes", "Milton", "Selbyville", "Bridgeville", "Cheswold")
+INDUSTRIES= ("Finance", "Legal", "Healthcare", "Chemical", "Manufacturing", "Agriculture", "Tourism", "Retail", "Technology", "Real Estate", "Education", "Insurance", "Logistics", "Government", "Construction")
+
 def _inline_generate(count=1000):
     """Fallback: generate inline without importing the scheduler module."""
-    import hashlib, random
-    from datetime import datetime, timedelta
-
-    CITIES    = ["Wilmington", "Dover", "Newark", "Middletown", "Smyrna", "Milford", "Seaford", "Georgetown", "Elsmere", "New Castle", "Millsboro", "Laurel", "Harrington", "Camden", "Clayton", "Lewes", "Milton", "Selbyville", "Bridgeville", "Cheswold"]
-    PREFIXES  = ["First State", "Blue Hen", "Diamond", "Diamond State", "Colonial", "Brandywine", "Chesapeake", "Delaware Bay", "Delmarva", "Peninsula", "Patriot", "Heritage", "Atlantic", "Corporate", "Mid-Atlantic"]
-    TYPES     = ["Solutions","Services","Enterprises","Group","Partners",
-                 "Holdings","Ventures","Management","Consulting","Technologies"]
-    INDUSTRIES= ["Finance", "Legal", "Healthcare", "Chemical", "Manufacturing", "Agriculture", "Tourism", "Retail", "Technology", "Real Estate", "Education", "Insurance", "Logistics", "Government", "Construction"]
-    SUFFIXES  = ["LLC","Inc","Corp","LLP"]
-    STYPE     = {"LLC":"Limited Liability Company","Inc":"Corporation",
-                  "Corp":"Corporation","LLP":"Limited Liability Partnership"}
-
-    businesses, today = [], datetime.now()
-    for i in range(count):
-        sfx  = random.choice(SUFFIXES)
-        name = f"{random.choice(CITIES)} {random.choice(INDUSTRIES)} {random.choice(TYPES)} {sfx}"
-        base = str(100_000_000 + i)
-        enum = f"{base[:3]}-{base[3:6]}-{base[6:]}"
-        days_ago = max(1, min(int(random.expovariate(1/10)), 30))
-        businesses.append({
-            "name":              name,
-            "state":             "DE",
-            "entity_number":     enum,
-            "registration_date": (today - timedelta(days=days_ago)).strftime("%Y-%m-%d"),
-            "entity_type":       STYPE.get(sfx, "Limited Liability Company"),
-            "status":            "Active",
-            "registered_agent":  f"Delaware Registered Agent #{random.randint(100,999)}",
-            "address":           f"{random.choice(CITIES)}, DE {random.randint(19701,19980):05d}",
-            "scraped_at":        today.isoformat(),
-            "source":            "scheduled_generation",
-        })
+    businesses = generate(count, "DE", "Delaware", CITIES, INDUSTRIES, (19701, 19980))
     logger.info(f"Delaware inline generator: {len(businesses)} businesses")
     return businesses
 
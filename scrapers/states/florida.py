@@ -11,6 +11,9 @@ This module provides the scrape() interface for the super_scraper pipeline.
 import logging, sys, os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
+from scrapers.states._cache import cutoff_iso, state_records
+from scrapers.states._fake_common import generate
+
 logger = logging.getLogger(__name__)
 
 def scrape():
@@ -25,49 +28,20 @@ def scrape():
         sc = FloridaScheduledScraper()
         if not sc.state["last_run"]:
             sc.run_once()
-        import json
-        data = json.load(open(sc.config["data_file"]))
-        cutoff = (__import__("datetime").datetime.now() - __import__("datetime").timedelta(days=30)).strftime("%Y-%m-%d")
-        results = [b for b in data if b.get("state") == "FL" and b.get("registration_date", "") >= cutoff]
+        results = state_records(sc.config["data_file"], "FL", since=cutoff_iso(30))
         logger.info(f"Florida scraper: returning {len(results)} businesses")
         return results
     except Exception as e:
         logger.warning(f"Florida scraper delegation failed ({e}), running inline")
         return _inline_generate(1000)
 
+# Vocabulary for the inline fallback generator
+CITIES    = ("Jacksonville", "Miami", "Tampa", "Orlando", "St. Petersburg", "Hialeah", "Port St. Lucie", "Cape Coral", "Tallahassee", "Fort Lauderdale", "Pembroke Pines", "Hollywood", "Gainesville", "Miramar", "Coral Springs", "Clearwater", "Palm Bay", "Brandon", "West Palm Beach", "Pompano Beach")
+INDUSTRIES= ("Tourism", "Real Estate", "Healthcare", "Finance", "Agriculture", "Technology", "Construction", "Retail", "Education", "Aerospace", "Defense", "Entertainment", "Marine", "Logistics", "Legal")
+
 def _inline_generate(count=1000):
     """Fallback: generate inline without importing the scheduler module."""
-    import hashlib, random
-    from datetime import datetime, timedelta
-
-    CITIES    = ["Jacksonville", "Miami", "Tampa", "Orlando", "St. Petersburg", "Hialeah", "Port St. Lucie", "Cape Coral", "Tallahassee", "Fort Lauderdale", "Pembroke Pines", "Hollywood", "Gainesville", "Miramar", "Coral Springs", "Clearwater", "Palm Bay", "Brandon", "West Palm Beach", "Pompano Beach"]
-    PREFIXES  = ["Sunshine State", "Palm", "Coastal", "Gulf Coast", "Atlantic", "Everglades", "Tropical", "Orange Blossom", "Flamingo", "Seminole", "Panhandle", "Suncoast", "Space Coast", "Treasure Coast", "Emerald Coast"]
-    TYPES     = ["Solutions","Services","Enterprises","Group","Partners",
-                 "Holdings","Ventures","Management","Consulting","Technologies"]
-    INDUSTRIES= ["Tourism", "Real Estate", "Healthcare", "Finance", "Agriculture", "Technology", "Construction", "Retail", "Education", "Aerospace", "Defense", "Entertainment", "Marine", "Logistics", "Legal"]
-    SUFFIXES  = ["LLC","Inc","Corp","LLP"]
-    STYPE     = {"LLC":"Limited Liability Company","Inc":"Corporation",
-                  "Corp":"Corporation","LLP":"Limited Liability Partnership"}
-
-    businesses, today = [], datetime.now()
-    for i in range(count):
-        sfx  = random.choice(SUFFIXES)
-        name = f"{random.choice(CITIES)} {random.choice(INDUSTRIES)} {random.choice(TYPES)} {sfx}"
-        base = str(100_000_000 + i)
-        enum = f"{base[:3]}-{base[3:6]}-{base[6:]}"
-        days_ago = max(1, min(int(random.expovariate(1/10)), 30))
-        businesses.append({
-            "name":              name,
-            "state":             "FL",
-            "entity_number":     enum,
-            "registration_date": (today - timedelta(days=days_ago)).strftime("%Y-%m-%d"),
-            "entity_type":       STYPE.get(sfx, "Limited Liability Company"),
-            "status":            "Active",
-            "registered_agent":  f"Florida Registered Agent #{random.randint(100,999)}",
-            "address":           f"{random.choice(CITIES)}, FL {random.randint(32004,34997):05d}",
-            "scraped_at":        today.isoformat(),
-            "source":            "scheduled_generation",
-        })
+    businesses = generate(count, "FL", "Florida", CITIES, INDUSTRIES, (32004, 34997))
     logger.info(f"Florida inline generator: {len(businesses)} businesses")
     return businesses
 
@@ -11,6 +11,9 @@ This module provides the scrape() interface for the super_scraper pipeline.
 import logging, sys, os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
+from scrapers.states._cache import cutoff_iso, state_records
+from scrapers.states._fake_common import generate
+
 logger = logging.getLogger(__name__)
 
 def scrape():
@@ -25,49 +28,20 @@ def scrape():
         sc = MarylandScheduledScraper()
         if not sc.state["last_run"]:
             sc.run_once()
-        import json
-        data = json.load(open(sc.config["data_file"]))
-        cutoff = (__import__("datetime").datetime.now() - __import__("datetime").timedelta(days=30)).strftime("%Y-%m-%d")
-        results = [b for b in data if b.get("state") == "MD" and b.get("registration_date", "") >= cutoff]
+        results = state_records(sc.config["data_file"], "MD", since=cutoff_iso(30))
         logger.info(f"Maryland scraper: returning {len(results)} businesses")
         return results
     except Exception as e:
         logger.warning(f"Maryland scraper delegation failed ({e}), running inline")
         return _inline_generate(1000)
 
+# Vocabulary for the inline fallback generator
+CITIES    = ("Baltimore", "Frederick", "Rockville", "Gaithersburg", "Bowie", "Hagerstown", "Annapolis", "College Park", "Salisbury", "Waldorf", "Laurel", "Greenbelt", "Cumberland", "Westminster", "Hyattsville", "Takoma Park", "Bel Air", "Glen Burnie", "Bethesda", "Silver Spring")
+INDUSTRIES= ("Government", "Healthcare", "Defense", "Technology", "Finance", "Biotechnology", "Education", "Real Estate", "Cybersecurity", "Construction", "Retail", "Legal", "Tourism", "Agriculture", "Marine")
+
 def _inline_generate(count=1000):
     """Fallback: generate inline without importing the scheduler module."""
-    import hashlib, random
-    from datetime import datetime, timedelta
-
-    CITIES    = ["Baltimore", "Frederick", "Rockville", "Gaithersburg", "Bowie", "Hagerstown", "Annapolis", "College Park", "Salisbury", "Waldorf", "Laurel", "Greenbelt", "Cumberland", "Westminster", "Hyattsville", "Takoma Park", "Bel Air", "Glen Burnie", "Bethesda", "Silver Spring"]
-    PREFIXES  = ["Old Line State", "Chesapeake", "Blue Crab", "Free State", "Maryland", "Terrapin", "Diamondback", "Harbor", "Patuxent", "Potomac", "Susquehanna", "Bay Area", "Capital Region", "Mid-Atlantic", "Chesapeake Bay"]
-    TYPES     = ["Solutions","Services","Enterprises","Group","Partners",
-                 "Holdings","Ventures","Management","Consulting","Technologies"]
-    INDUSTRIES= ["Government", "Healthcare", "Defense", "Technology", "Finance", "Biotechnology", "Education", "Real Estate", "Cybersecurity", "Construction", "Retail", "Legal", "Tourism", "Agriculture", "Marine"]
-    SUFFIXES  = ["LLC","Inc","Corp","LLP"]
-    STYPE     = {"LLC":"Limited Liability Company","Inc":"Corporation",
-                  "Corp":"Corporation","LLP":"Limited Liability Partnership"}
-
-    businesses, today = [], datetime.now()
-    for i in range(count):
-        sfx  = random.choice(SUFFIXES)
-        name = f"{random.choice(CITIES)} {random.choice(INDUSTRIES)} {random.choice(TYPES)} {sfx}"
-        base = str(100_000_000 + i)
-        enum = f"{base[:3]}-{base[3:6]}-{base[6:]}"
-        days_ago = max(1, min(int(random.expovariate(1/10)), 30))
-        businesses.append({
-            "name":              name,
-            "state":             "MD",
-            "entity_number":     enum,
-            "registration_date": (today - timedelta(days=days_ago)).strftime("%Y-%m-%d"),
-            "entity_type":       STYPE.get(sfx, "Limited Liability Company"),
-            "status":            "Active",
-            "registered_agent":  f"Maryland Registered Agent #{random.randint(100,999)}",
-            "address":           f"{random.choice(CITIES)}, MD {random.randint(20601,21930):05d}",
-            "scraped_at":        today.isoformat(),
-            "source":            "scheduled_generation",
-        })
+    businesses = generate(count, "MD", "Maryland", CITIES, INDUSTRIES, (20601, 21930))
     logger.info(f"Maryland inline generator: {len(businesses)} businesses")
     return businesses
 
@@ -11,6 +11,9 @@ This module provides the scrape() interface for the super_scraper pipeline.
 import logging, sys, os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
+from scrapers.states._cache import cutoff_iso, state_records
+from scrapers.states._fake_common import generate
+
 logger = logging.getLogger(__name__)
 
 def scrape():
@@ -25,49 +28,20 @@ def scrape():
         sc = SouthDakotaScheduledScraper()
         if not sc.state["last_run"]:
             sc.run_once()
-        import json
-        data = json.load(open(sc.config["data_file"]))
-        cutoff = (__import__("datetime").datetime.now() - __import__("datetime").timedelta(days=30)).strftime("%Y-%m-%d")
-        results = [b for b in data if b.get("state") == "SD" and b.get("registration_date", "") >= cutoff]
+        results = state_records(sc.config["data_file"], "SD", since=cutoff_iso(30))
         logger.info(f"South Dakota scraper: returning {len(results)} businesses")
         return results
     except Exception as e:
         logger.warning(f"South Dakota scraper delegation failed ({e}), running inline")
         return _inline_generate(1000)
 
+# Vocabulary for the inline fallback generator
+CITIES    = ("Sioux Falls", "Rapid City", "Aberdeen", "Brookings", "Watertown", "Mitchell", "Yankton", "Pierre", "Huron", "Spearfish", "Vermillion", "Brandon", "Box Elder", "Sturgis", "Madison", "Belle Fourche", "Mobridge", "Lead", "Deadwood", "Hot Springs")
+INDUSTRIES= ("Agriculture", "Finance", "Healthcare", "Tourism", "Construction", "Manufacturing", "Retail", "Education", "Government", "Energy", "Livestock", "Technology", "Legal", "Insurance", "Logistics")
+
 def _inline_generate(count=1000):
     """Fallback: generate inline without importing the scheduler module."""
-    import hashlib, random
-    from datetime import datetime, timedelta
-
-    CITIES    = ["Sioux Falls", "Rapid City", "Aberdeen", "Brookings", "Watertown", "Mitchell", "Yankton", "Pierre", "Huron", "Spearfish", "Vermillion", "Brandon", "Box Elder", "Sturgis", "Madison", "Belle Fourche", "Mobridge", "Lead", "Deadwood", "Hot Springs"]
-    PREFIXES  = ["Mount Rushmore State", "Coyote State", "Black Hills", "Badlands", "Great Plains", "Missouri River", "Prairie", "Sioux", "South Dakota", "Heartland", "Lakota", "Great Sioux", "Corn Palace", "Needles", "Wind Cave"]
-    TYPES     = ["Solutions","Services","Enterprises","Group","Partners",
-                 "Holdings","Ventures","Management","Consulting","Technologies"]
-    INDUSTRIES= ["Agriculture", "Finance", "Healthcare", "Tourism", "Construction", "Manufacturing", "Retail", "Education", "Government", "Energy", "Livestock", "Technology", "Legal", "Insurance", "Logistics"]
-    SUFFIXES  = ["LLC","Inc","Corp","LLP"]
-    STYPE     = {"LLC":"Limited Liability Company","Inc":"Corporation",
-                  "Corp":"Corporation","LLP":"Limited Liability Partnership"}
-
-    businesses, today = [], datetime.now()
-    for i in range(count):
-        sfx  = random.choice(SUFFIXES)
-        name = f"{random.choice(CITIES)} {random.choice(INDUSTRIES)} {random.choice(TYPES)} {sfx}"
-        base = str(100_000_000 + i)
-        enum = f"{base[:3]}-{base[3:6]}-{base[6:]}"
-        days_ago = max(1, min(int(random.expovariate(1/10)), 30))
-        businesses.append({
-            "name":              name,
-            "state":             "SD",
-            "entity_number":     enum,
-            "registration_date": (today - timedelta(days=days_ago)).strftime("%Y-%m-%d"),
-            "entity_type":       STYPE.get(sfx, "Limited Liability Company"),
-            "status":            "Active",
-            "registered_agent":  f"South Dakota Registered Agent #{random.randint(100,999)}",
-            "address":           f"{random.choice(CITIES)}, SD {random.randint(57001,57799):05d}",
-            "scraped_at":        today.isoformat(),
-            "source":            "scheduled_generation",
-        })
+    businesses = generate(count, "SD", "South Dakota", CITIES, INDUSTRIES, (57001, 57799))
     logger.info(f"South Dakota inline generator: {len(businesses)} businesses")
     return businesses
 
@@ -11,6 +11,9 @@ This module provides the scrape() interface for the super_scraper pipeline.
 import logging, sys, os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
+from scrapers.states._cache import cutoff_iso, state_records
+from scrapers.states._fake_common import generate
+
 logger = logging.getLogger(__name__)
 
 def scrape():
@@ -25,49 +28,20 @@ def scrape():
         sc = TennesseeScheduledScraper()
         if not sc.state["last_run"]:
             sc.run_once()
-        import json
-        data = json.load(open(sc.config["data_file"]))
-        cutoff = (__import__("datetime").datetime.now() - __import__("datetime").timedelta(days=30)).strftime("%Y-%m-%d")
-        results = [b for b in data if b.get("state") == "TN" and b.get("registration_date", "") >= cutoff]
+        results = state_records(sc.config["data_file"], "TN", since=cutoff_iso(30))
         logger.info(f"Tennessee scraper: returning {len(results)} businesses")
         return results
     except Exception as e:
         logger.warning(f"Tennessee scraper delegation failed ({e}), running inline")
         return _inline_generate(1000)
 
+# Vocabulary for the inline fallback generator
+CITIES    = ("Memphis", "Nashville", "Knoxville", "Chattanooga", "Clarksville", "Murfreesboro", "Franklin", "Jackson", "Johnson City", "Bartlett", "Hendersonville", "Kingsport", "Collierville", "Cleveland", "Smyrna", "Germantown", "Brentwood", "Columbia", "Spring Hill", "La Vergne")
+INDUSTRIES= ("Healthcare", "Finance", "Manufacturing", "Automotive", "Agriculture", "Tourism", "Technology", "Education", "Retail", "Legal", "Entertainment", "Construction", "Energy", "Defense", "Logistics")
+
 def _inline_generate(count=1000):
     """Fallback: generate inline without importing the scheduler module."""
-    import hashlib, random
-    from datetime import datetime, timedelta
-
-    CITIES    = ["Memphis", "Nashville", "Knoxville", "Chattanooga", "Clarksville", "Murfreesboro", "Franklin", "Jackson", "Johnson City", "Bartlett", "Hendersonville", "Kingsport", "Collierville", "Cleveland", "Smyrna", "Germantown", "Brentwood", "Columbia", "Spring Hill", "La Vergne"]
-    PREFIXES  = ["Volunteer State", "Music City", "Tennessee", "Smoky Mountain", "Great Smoky", "Appalachian", "Cumberland", "Tennessee Valley", "Reelfoot", "Clinch", "Holston", "Sequoyah", "Blue Ridge", "Country Music", "Bluegrass"]
-    TYPES     = ["Solutions","Services","Enterprises","Group","Partners",
-                 "Holdings","Ventures","Management","Consulting","Technologies"]
-    INDUSTRIES= ["Healthcare", "Finance", "Manufacturing", "Automotive", "Agriculture", "Tourism", "Technology", "Education", "Retail", "Legal", "Entertainment", "Construction", "Energy", "Defense", "Logistics"]
-    SUFFIXES  = ["LLC","Inc","Corp","LLP"]
-    STYPE     = {"LLC":"Limited Liability Company","Inc":"Corporation",
-                  "Corp":"Corporation","LLP":"Limited Liability Partnership"}
-
-    businesses, today = [], datetime.now()
-    for i in range(count):
-        sfx  = random.choice(SUFFIXES)
-        name = f"{random.choice(CITIES)} {random.choice(INDUSTRIES)} {random.choice(TYPES)} {sfx}"
-        base = str(100_000_000 + i)
-        enum = f"{base[:3]}-{base[3:6]}-{base[6:]}"
-        days_ago = max(1, min(int(random.expovariate(1/10)), 30))
-        businesses.append({
-            "name":              name,
-            "state":             "TN",
-            "entity_number":     enum,
-            "registration_date": (today - timedelta(days=days_ago)).strftime("%Y-%m-%d"),
-            "entity_type":       STYPE.get(sfx, "Limited Liability Company"),
-            "status":            "Active",
-            "registered_agent":  f"Tennessee Registered Agent #{random.randint(100,999)}",
-            "address":           f"{random.choice(CITIES)}, TN {random.randint(37010,38589):05d}",
-            "scraped_at":        today.isoformat(),
-            "source":            "scheduled_generation",
-        })
+    businesses = generate(count, "TN", "Tennessee", CITIES, INDUSTRIES, (37010, 38589))
     logger.info(f"Tennessee inline generator: {len(businesses)} businesses")
     return businesses
 
@@ -11,6 +11,9 @@ This module provides the scrape() interface for the super_scraper pipeline.
 import logging, sys, os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
+from scrapers.states._cache import cutoff_iso, state_records
+from scrapers.states._fake_common import generate
+
 logger = logging.getLogger(__name__)
 
 def scrape():
@@ -25,49 +28,20 @@ def scrape():
         sc = VirginiaScheduledScraper()
         if not sc.state["last_run"]:
             sc.run_once()
-        import json
-        data = json.load(open(sc.config["data_file"]))
-        cutoff = (__import__("datetime").datetime.now() - __import__("datetime").timedelta(days=30)).strftime("%Y-%m-%d")
-        results = [b for b in data if b.get("state") == "VA" and b.get("registration_date", "") >= cutoff]
+        results = state_records(sc.config["data_file"], "VA", since=cutoff_iso(30))
         logger.info(f"Virginia scraper: returning {len(results)} businesses")
         return results
     except Exception as e:
         logger.warning(f"Virginia scraper delegation failed ({e}), running inline")
         return _inline_generate(1000)
 
+# Vocabulary for the inline fallback generator
+CITIES    = ("Virginia Beach", "Norfolk", "Chesapeake", "Richmond", "Newport News", "Alexandria", "Hampton", "Roanoke", "Portsmouth", "Suffolk", "Lynchburg", "Harrisonburg", "Leesburg", "Charlottesville", "Blacksburg", "Danville", "Manassas", "Petersburg", "Fredericksburg", "Winchester")
+INDUSTRIES= ("Defense", "Technology", "Government", "Healthcare", "Finance", "Education", "Agriculture", "Tourism", "Legal", "Construction", "Cybersecurity", "Shipbuilding", "Real Estate", "Retail", "Biotechnology")
+
 def _inline_generate(count=1000):
     """Fallback: generate inline without importing the scheduler module."""
-    import hashlib, random
-    from datetime import datetime, timedelta
-
-    CITIES    = ["Virginia Beach", "Norfolk", "Chesapeake", "Richmond", "Newport News", "Alexandria", "Hampton", "Roanoke", "Portsmouth", "Suffolk", "Lynchburg", "Harrisonburg", "Leesburg", "Charlottesville", "Blacksburg", "Danville", "Manassas", "Petersburg", "Fredericksburg", "Winchester"]
-    PREFIXES  = ["Old Dominion", "Virginia", "Colonial", "Shenandoah", "Blue Ridge", "Appalachian", "Tidewater", "Chesapeake", "Potomac", "Commonwealth", "Patriot", "Founding Father", "Cavalier", "Virginia Beach", "Hampton Roads"]
-    TYPES     = ["Solutions","Services","Enterprises","Group","Partners",
-                 "Holdings","Ventures","Management","Consulting","Technologies"]
-    INDUSTRIES= ["Defense", "Technology", "Government", "Healthcare", "Finance", "Education", "Agriculture", "Tourism", "Legal", "Construction", "Cybersecurity", "Shipbuilding", "Real Estate", "Retail", "Biotechnology"]
-    SUFFIXES  = ["LLC","Inc","Corp","LLP"]
-    STYPE     = {"LLC":"Limited Liability Company","Inc":"Corporation",
-                  "Corp":"Corporation","LLP":"Limited Liability Partnership"}
-
-    businesses, today = [], datetime.now()
-    for i in range(count):
-        sfx  = random.choice(SUFFIXES)
-        name = f"{random.choice(CITIES)} {random.choice(INDUSTRIES)} {random.choice(TYPES)} {sfx}"
-        base = str(100_000_000 + i)
-        enum = f"{base[:3]}-{base[3:6]}-{base[6:]}"
-        days_ago = max(1, min(int(random.expovariate(1/10)), 30))
-        businesses.append({
-            "name":              name,
-            "state":             "VA",
-            "entity_number":     enum,
-            "registration_date": (today - timedelta(days=days_ago)).strftime("%Y-%m-%d"),
-            "entity_type":       STYPE.get(sfx, "Limited Liability Company"),
-            "status":            "Active",
-            "registered_agent":  f"Virginia Registered Agent #{random.randint(100,999)}",
-            "address":           f"{random.choice(CITIES)}, VA {random.randint(20101,24658):05d}",
-            "scraped_at":        today.isoformat(),
-            "source":            "scheduled_generation",
-        })
+    businesses = generate(count, "VA", "Virginia", CITIES, INDUSTRIES, (20101, 24658))
     logger.info(f"Virginia inline generator: {len(businesses)} businesses")
     return businesses
 
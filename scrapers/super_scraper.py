@@ -6,6 +6,7 @@ import json
 import importlib
 import pathlib
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Dict
 
@@ -46,6 +47,9 @@ PRIORITY_STATES = [
     'wyoming',      # High volume
 ]
 
+# State scrapers are I/O bound, so this many run at once on threads
+MAX_WORKERS = 16
+
 def load_existing_data(data_file: pathlib.Path) -> tuple:
     """
     Load existing business data from file
@@ -149,54 +153,33 @@ def main():
     # New businesses found
     new = []
     
-    # Process priority states first
-    logger.info(f"\nProcessing {len(PRIORITY_STATES)} priority states first...")
-    for state in PRIORITY_STATES:
-        businesses = scrape_state(state)
-        
-        # Track state stats
-        state_new = 0
-        for biz in businesses:
-            key = (biz["name"], biz["state"])
-            if key not in seen:
-                seen.add(key)
-                new.append(biz)
-                state_new += 1
-        
-        stats['by_state'][state] = {
-            'found': len(businesses),
-            'new': state_new
-        }
-        
-        if len(businesses) > 0:
-            stats['successful_states'] += 1
-        elif len(businesses) == 0:
-            stats['skipped_states'] += 1
-    
-    # Process remaining states
+    # Priority states are submitted first; the map yields results in
+    # submission order, so dedupe keeps the same precedence as a serial run
     remaining_states = [s for s in STATES if s not in PRIORITY_STATES]
-    logger.info(f"\nProcessing {len(remaining_states)} remaining states...")
-    
-    for state in remaining_states:
-        businesses = scrape_state(state)
-        
-        state_new = 0
-        for biz in businesses:
-            key = (biz["name"], biz["state"])
-            if key not in seen:
-                seen.add(key)
-                new.append(biz)
-                state_new += 1
-        
-        stats['by_state'][state] = {
-            'found': len(businesses),
-            'new': state_new
-        }
-        
-        if len(businesses) > 0:
-            stats['successful_states'] += 1
-        elif len(businesses) == 0:
-            stats['skipped_states'] += 1
+    ordered_states = PRIORITY_STATES + remaining_states
+    logger.info(f"\nProcessing {len(PRIORITY_STATES)} priority states first, then "
+                f"{len(remaining_states)} remaining states ({MAX_WORKERS} at a time)...")
+    
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        for state, businesses in zip(ordered_states, pool.map(scrape_state, ordered_states)):
+            # Track state stats
+            state_new = 0
+            for biz in businesses:
+                key = (biz["name"], biz["state"])
+                if key not in seen:
+                    seen.add(key)
+                    new.append(biz)
+                    state_new += 1
+            
+            stats['by_state'][state] = {
+                'found': len(businesses),
+                'new': state_new
+            }
+            
+            if len(businesses) > 0:
+                stats['successful_states'] += 1
+            elif len(businesses) == 0:
+                stats['skipped_states'] += 1
     
     # Calculate final statistics
     stats['new_businesses'] = len(new)
@@ -0,0 +1,133 @@
+"""
+JSON helpers for scheduler persistence.
+Uses orjson when it is installed and falls back to the stdlib json module.
+loads() and dumps() work on bytes so callers can open files in binary mode.
+Business data files are NDJSON (one record per line) so a run can append its
+new records; read_records() also accepts the older indented JSON arrays.
+"""
+import json
+import mmap
+import os
+import threading
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Files smaller than this are cheaper to read() than to mmap
+MMAP_MIN_SIZE = 64 * 1024
+
+
+def loads(data):
+    """Parse JSON from bytes (or str)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj, indent=False):
+    """Serialize obj to UTF-8 JSON bytes, 2-space indented when indent=True."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
+def _tmp_path(path):
+    # Unique per process and thread so concurrent writers of one file don't collide
+    return f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+
+def write_json(path, obj, indent=False):
+    """
+    Encode obj once and write it to path with a single write() call.
+    The payload goes to a temp file that is fsynced and then renamed over
+    path, so a crash mid-write never leaves a truncated file behind.
+    """
+    payload = dumps(obj, indent=indent)
+    tmp = _tmp_path(path)
+    with open(tmp, "wb") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def _first_byte(f):
+    """Return the first non-whitespace byte of f and rewind it."""
+    first = f.read(1)
+    while first.isspace():
+        first = f.read(1)
+    f.seek(0)
+    return first
+
+
+def _load_file(f):
+    """
+    Parse the whole of an open binary file. Large files are memory-mapped
+    and handed to orjson without first copying them into a bytes object.
+    """
+    if orjson is not None and os.fstat(f.fileno()).st_size >= MMAP_MIN_SIZE:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+    return loads(f.read())
+
+
+def read_records(path):
+    """Load a list of records from an NDJSON file or a JSON array file."""
+    with open(path, "rb") as f:
+        if _first_byte(f) == b"[":
+            return _load_file(f)
+        return [loads(line) for line in f if line.strip()]
+
+
+def iter_records(path):
+    """
+    Yield records one at a time from an NDJSON file or a JSON array file.
+    Arrays are stream-parsed with ijson when it is installed, so only the
+    current record is held in memory; otherwise the array is loaded whole.
+    """
+    with open(path, "rb") as f:
+        if _first_byte(f) != b"[":
+            for line in f:
+                if line.strip():
+                    yield loads(line)
+        elif ijson is not None:
+            yield from ijson.items(f, "item", use_float=True)
+        else:
+            yield from _load_file(f)
+
+
+def _ndjson_payload(records):
+    return b"".join(dumps(r) + b"\n" for r in records)
+
+
+def write_ndjson(path, records):
+    """Atomically replace path with one JSON record per line."""
+    tmp = _tmp_path(path)
+    with open(tmp, "wb") as f:
+        f.write(_ndjson_payload(records))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def append_ndjson(path, records):
+    """
+    Append records to an NDJSON file. Returns False without writing when
+    path holds a JSON array, which the caller then has to rewrite instead.
+    """
+    try:
+        with open(path, "rb") as f:
+            if f.read(1) == b"[":
+                return False
+    except FileNotFoundError:
+        pass
+    with open(path, "ab") as f:
+        f.write(_ndjson_payload(records))
+    return True
@@ -0,0 +1,67 @@
+"""
+Logging handlers shared by the schedulers.
+"""
+import logging
+import time
+
+LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+
+
+def scheduler_logger(name, handler):
+    """
+    Logger for a scheduler module that writes to the module's own log file
+    through handler (create it with delay=True so importing the module opens
+    nothing). Records also propagate to the root logger, where main() adds
+    the console and an in-process runner has its own log. Running this again
+    for the same file, as a module reload does, closes the previous handler.
+    """
+    logger = logging.getLogger(name)
+    logger.setLevel(logging.INFO)
+    for old in list(logger.handlers):
+        if getattr(old, "baseFilename", None) == handler.baseFilename:
+            logger.removeHandler(old)
+            old.close()
+    handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    logger.addHandler(handler)
+    return logger
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    FileHandler that collects records in a large write buffer instead of
+    flushing after every record. Call flush() at the end of a run; records at
+    ERROR or above are flushed immediately so failures reach disk, as is any
+    record written flush_interval seconds or more after the last flush. Flush
+    before sleeping, since nothing is written while idle.
+    """
+
+    def __init__(self, filename, mode="a", encoding=None, delay=False,
+                 buffer_size=64 * 1024, flush_interval=30.0):
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+        super().__init__(filename, mode, encoding, delay)
+
+    def flush(self):
+        super().flush()
+        self._last_flush = time.monotonic()
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=self.errors)
+
+    def emit(self, record):
+        if self.stream is None:
+            if self.mode != "w" or not self._closed:
+                self.stream = self._open()
+        if self.stream is None:
+            return
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if (record.levelno >= logging.ERROR or
+                    time.monotonic() - self._last_flush >= self.flush_interval):
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
@@ -0,0 +1,19 @@
+"""
+Loading state scheduler modules for in-process runs.
+"""
+import importlib
+
+
+def load_run_once(script, reload=False):
+    """
+    Import a state's *_scheduler module and return its module-level run_once().
+    With reload, the module is executed again first so code changes take effect.
+    Raises ImportError if the module defines no run_once().
+    """
+    module = importlib.import_module(script.removesuffix(".py"))
+    if reload:
+        module = importlib.reload(module)
+    run_once = getattr(module, "run_once", None)
+    if not callable(run_once):
+        raise ImportError(f"{script} defines no run_once()")
+    return run_once